@@ -24,7 +24,7 @@ import logging
 import pathlib
 import re
 
-from trestle.oscal import OSCAL_VERSION_REGEX
+from trestle.oscal import NCNAME_REGEX, NON_SPACE_REGEX, OSCAL_VERSION_REGEX, UUID_REGEX
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -32,6 +32,16 @@ logger.addHandler(logging.StreamHandler())
 
 class_header = 'class '
 
+# per-class Config emitted by datamodel-codegen, redundant with OscalBaseModel.Config
+config_line = '    class Config:'
+config_extra_line = '        extra = Extra.forbid'
+
+# datetime fields, which get a validator trying datetime.fromisoformat before pydantic's parser
+datetime_field_pattern = re.compile(r'^    (\w+): (?:Optional\[)?datetime\b')
+
+# fields with a small closed vocabulary of values, which get a validator interning the value
+interned_fields = {'SystemComponent': ['type'], 'Response': ['lifecycle']}
+
 # List of filestems not including 'complete' or 'common'
 # 'common' is generated by this script.  'complete.py' comes from NIST and is ignored
 fstems = ['assessment_plan', 'assessment_results', 'catalog', 'component', 'poam', 'profile', 'ssp']
@@ -121,6 +131,105 @@ from trestle.core.base_model import OscalBaseModel
 from trestle.oscal import OSCAL_VERSION_REGEX, OSCAL_VERSION
 """
 
+# common.py also needs the imports used by the shared string types it defines
+common_header = main_header.replace(
+    'from pydantic import AnyUrl, EmailStr, Extra, Field, conint, constr, validator\n',
+    'from pydantic import AnyUrl, ConstrainedStr, EmailStr, Extra, Field, conint, constr, errors, validator\n'
+    'from pydantic.validators import str_validator\n'
+).replace(
+    'from trestle.oscal import OSCAL_VERSION_REGEX, OSCAL_VERSION\n',
+    'from trestle.oscal import OSCAL_VERSION_REGEX, OSCAL_VERSION, NCNAME_REGEX, NON_SPACE_REGEX, UUID_REGEX\n'
+).replace('import re\n', 'import re\nimport sys\n')
+
+# constr types emitted by datamodel-codegen for patterns used across many oscal fields
+# each is replaced by one shared type defined in common.py
+shared_str_types = {UUID_REGEX: 'UUIDStr', NCNAME_REGEX: 'NCNameStr', NON_SPACE_REGEX: 'NonSpaceStr'}
+
+shared_str_types_code = """
+class _PatternStr(ConstrainedStr):
+    \"\"\"
+    Constrained string checked against a precompiled pattern without the generic constr validator chain.
+    \"\"\"
+
+    @classmethod
+    def __get_validators__(cls):
+        yield str_validator
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        if cls.regex.match(value) is None:
+            raise errors.StrRegexError(pattern=cls.regex.pattern)
+        return value
+
+
+UUID_RE = re.compile(UUID_REGEX)
+
+
+class UUIDStr(_PatternStr):
+    regex = UUID_RE
+
+
+NCNAME_RE = re.compile(NCNAME_REGEX)
+
+
+class NCNameStr(_PatternStr):
+    regex = NCNAME_RE
+
+
+NON_SPACE_RE = re.compile(NON_SPACE_REGEX)
+
+
+class NonSpaceStr(_PatternStr):
+    \"\"\"
+    String with no leading or trailing whitespace and no embedded newline.
+
+    Checked directly with the same result as NON_SPACE_RE.match, which also allows a single trailing newline.
+    \"\"\"
+
+    regex = NON_SPACE_RE
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        stripped = value[:-1] if value.endswith('\\n') else value
+        if not stripped or stripped[0].isspace() or stripped[-1].isspace() or '\\n' in stripped:
+            raise errors.StrRegexError(pattern=cls.regex.pattern)
+        return value
+
+
+"""
+
+# only strings in this form, which pydantic parses to the same value, take the fromisoformat path
+iso_datetime_code = """ISO_DATETIME_RE = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}(:[0-9]{2}(\\.[0-9]{3}|\\.[0-9]{6})?)?(Z|[+-][0-9]{2}:[0-9]{2})?'
+)
+
+
+def parse_iso_datetime(value: Any) -> Any:
+    \"\"\"
+    Parse a datetime string with datetime.fromisoformat when pydantic would parse it to the same value.
+
+    Anything else is returned unchanged for pydantic's own datetime parsing, which also reports the errors.
+    \"\"\"
+    if isinstance(value, str) and ISO_DATETIME_RE.fullmatch(value):
+        try:
+            return datetime.fromisoformat(value[:-1] + '+00:00' if value[-1] == 'Z' else value)
+        except ValueError:
+            pass
+    return value
+
+
+"""
+
+intern_str_code = """def intern_str(value: Any) -> Any:
+    \"\"\"
+    Intern a string drawn from a small closed vocabulary so repeated values share one object.
+    \"\"\"
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+"""
+
 oscal_validator_code = """
 
     @validator('__root__')
@@ -637,6 +746,53 @@ def reorder_classes(fstem, classes):
     return reordered, forward_refs
 
 
+def use_shared_str_types(text, is_common):
+    """Replace constr types for shared patterns in the class text with the types defined in common."""
+    for regex, type_name in shared_str_types.items():
+        # black may split the constr call over several lines and add a trailing comma
+        constr_type = r"constr\(\s*regex=r'" + re.escape(regex) + r"',?\s*\)"
+        text = re.sub(constr_type, type_name if is_common else f'common.{type_name}', text)
+    return text
+
+
+def strip_config_block(lines):
+    """Drop the per-class Config setting extra forbid, which OscalBaseModel already provides."""
+    stripped = []
+    i = 0
+    while i < len(lines):
+        if lines[i] == config_line and i + 1 < len(lines) and lines[i + 1] == config_extra_line:
+            i += 2
+            if i < len(lines) and not lines[i].strip():
+                i += 1
+            continue
+        stripped.append(lines[i])
+        i += 1
+    return stripped
+
+
+def add_pre_validator(lines, fields, validator_name, func_name, is_common):
+    """Add a pre validator to the class calling a function from common on the given fields."""
+    if not fields:
+        return lines
+    field_list = ', '.join(f"'{field}'" for field in fields)
+    func = func_name if is_common else f'common.{func_name}'
+    last = max(i for i, line in enumerate(lines) if line.strip())
+    validator_lines = [
+        '',
+        f'    @validator({field_list}, pre=True)',
+        f'    def {validator_name}(cls, v):',
+        f'        return {func}(v)'
+    ]
+    return lines[:last + 1] + validator_lines + lines[last + 1:]
+
+
+def add_validators(c, lines, is_common):
+    """Add the datetime parsing and string interning validators the class needs."""
+    datetime_fields = [m.group(1) for m in (datetime_field_pattern.match(line) for line in lines) if m]
+    lines = add_pre_validator(lines, datetime_fields, 'datetime_from_iso_format', 'parse_iso_datetime', is_common)
+    return add_pre_validator(lines, interned_fields.get(c.name, []), 'intern_vocabulary', 'intern_str', is_common)
+
+
 def write_oscal(classes, forward_refs, fstem):
     """Write out oscal.py with all classes in it."""
     with open(f'trestle/oscal/{fstem}.py', 'w', encoding='utf8') as out_file:
@@ -644,14 +800,20 @@ def write_oscal(classes, forward_refs, fstem):
 
         out_file.write(license_header)
         out_file.write('\n')
-        out_file.write(main_header)
+        out_file.write(common_header if is_common else main_header)
 
         if not is_common:
             out_file.write('import trestle.oscal.common as common\n')
         out_file.write('\n\n')
 
+        if is_common:
+            out_file.write(shared_str_types_code)
+            out_file.write(iso_datetime_code)
+            out_file.write(intern_str_code)
+
         for c in classes:
-            out_file.writelines('\n'.join(c.lines) + '\n')
+            lines = add_validators(c, strip_config_block(c.lines), is_common)
+            out_file.writelines(use_shared_str_types('\n'.join(lines), is_common) + '\n')
             # add special validator for OscalVersion
             if c.name == 'OscalVersion':
                 out_file.write(oscal_validator_code)
@@ -41,7 +41,7 @@ TEST_CONFIG: dict = {}
 @pytest.fixture(scope='function')
 def rand_str():
     """Return a random string."""
-    rand_str = ''.join(random.choice(string.ascii_letters) for x in range(16))
+    rand_str = ''.join(random.choices(string.ascii_letters, k=16))
     return rand_str
 
 
@@ -142,6 +142,28 @@ def sample_catalog_missing_roles():
     return catalog_obj
 
 
+@pytest.fixture(scope='session')
+def sample_generated_catalog() -> cat.Catalog:
+    """Return a catalog generated from the model defaults, built once per session.
+
+    Treat as read-only, or deep copy before modifying.
+    """
+    return gens.generate_sample_model(cat.Catalog)
+
+
+@pytest.fixture(scope='session')
+def sample_generated_catalog_path(
+    tmp_path_factory: pytest.TempPathFactory, sample_generated_catalog: cat.Catalog
+) -> pathlib.Path:
+    """Return the path of a json file holding sample_generated_catalog, written once per session.
+
+    Copy the file rather than modifying it in place.
+    """
+    catalog_path = tmp_path_factory.mktemp('samples') / 'catalog.json'
+    sample_generated_catalog.oscal_write(catalog_path)
+    return catalog_path
+
+
 @pytest.fixture(scope='function')
 def sample_catalog_rich_controls():
     """Return a catalog with controls in groups and in the catalog itself."""
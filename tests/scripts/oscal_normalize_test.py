@@ -0,0 +1,64 @@
+# -*- mode:python; coding:utf-8 -*-
+
+# Copyright (c) 2020 IBM Corp. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for normalization of the generated oscal models."""
+
+import pathlib
+
+import scripts.oscal_normalize as oscal_normalize
+
+from trestle.oscal import NCNAME_REGEX, UUID_REGEX
+
+# class text as black formats it when the constr calls do not fit on one line
+black_class_text = f"""class Party(OscalBaseModel):
+    uuid: constr(
+        regex=r'{UUID_REGEX}'
+    ) = Field(..., description='A unique identifier for the party.', title='Party Universally Unique Identifier')
+    member_of_organizations: Optional[
+        List[
+            constr(
+                regex=r'{UUID_REGEX}',
+            )
+        ]
+    ] = Field(None, alias='member-of-organizations')
+    short_name: Optional[
+        constr(
+            regex=r'{NCNAME_REGEX}'
+        )
+    ] = Field(None, alias='short-name')
+"""
+
+
+def test_use_shared_str_types_multi_line(tmp_path: pathlib.Path, monkeypatch) -> None:
+    """Test constr calls split over several lines are replaced by the shared types."""
+    lines = black_class_text.splitlines()
+    class_text = oscal_normalize.ClassText(lines[0], 'catalog')
+    for line in lines[1:]:
+        class_text.add_line(line)
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'trestle' / 'oscal').mkdir(parents=True)
+    oscal_normalize.write_oscal([class_text], [], 'catalog')
+    text = (tmp_path / 'trestle' / 'oscal' / 'catalog.py').read_text(encoding='utf8')
+
+    assert 'constr(' not in text
+    assert text.count('common.UUIDStr') == 2
+    assert text.count('common.NCNameStr') == 1
+
+    common_text = oscal_normalize.use_shared_str_types(black_class_text, True)
+    assert 'constr(' not in common_text
+    assert 'common.' not in common_text
+    assert common_text.count('UUIDStr') == 2
+    assert common_text.count('NCNameStr') == 1
@@ -351,3 +351,19 @@ def test_oscal_serialize_json() -> None:
     new_catalog = oscatalog.Catalog.parse_obj(jsoned['catalog'])
 
     assert simple_catalog_obj.metadata.title == new_catalog.metadata.title
+
+
+@pytest.mark.parametrize(
+    'value', ['a', 'a b', ' a', 'a ', 'a\n', 'a\n\n', 'a\nb', 'a\rb', '\n', '', '\ta', 'a　', 'é x-1']
+)
+def test_non_space_str_matches_pattern(value) -> None:
+    """Test the direct non-space check agrees with the pattern it replaces."""
+
+    class Line(OscalBaseModel):
+        __root__: common.NonSpaceStr
+
+    if common.NON_SPACE_RE.match(value):
+        assert Line(__root__=value).__root__ == value
+    else:
+        with pytest.raises(ValueError):
+            Line(__root__=value)
@@ -100,25 +100,13 @@ def test_remove_failure(tmp_path: pathlib.Path):
 
     # Supply nonexistent element Roles for removal:
     element_path = ElementPath('catalog.metadata.roles')
-    try:
-        actual_remove_action, actual_catalog_removed_responsible_parties = RemoveCmd.remove(
-            element_path, catalog_with_responsible_parties
-        )
-    except Exception:
-        assert True
-    else:
-        AssertionError()
+    with pytest.raises(err.TrestleError):
+        RemoveCmd.remove(element_path, catalog_with_responsible_parties)
 
     # Supply a wildcard element for removal:
     element_path = ElementPath('catalog.*')
-    try:
-        actual_remove_action, actual_catalog_removed_responsible_parties = RemoveCmd.remove(
-            element_path, catalog_with_responsible_parties
-        )
-    except Exception:
-        assert True
-    else:
-        AssertionError()
+    with pytest.raises(err.TrestleError):
+        RemoveCmd.remove(element_path, catalog_with_responsible_parties)
 
 
 def test_run_failure_switches(tmp_path: pathlib.Path, monkeypatch: MonkeyPatch):
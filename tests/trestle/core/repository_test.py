@@ -182,7 +182,7 @@ def test_assemble(tmp_trestle_dir: pathlib.Path) -> None:
     repo.import_model(catalog_data, 'imported')
     success = repo.assemble_model(cat.Catalog, 'imported')
     assert success
-    dist_model_path = pathlib.Path(tmp_trestle_dir, 'dist', 'catalogs', 'imported.json')
+    dist_model_path = tmp_trestle_dir / 'dist' / 'catalogs' / 'imported.json'
     assert dist_model_path.exists()
 
 
@@ -315,14 +315,14 @@ def test_managed_split(tmp_trestle_dir: pathlib.Path) -> None:
     # test splitting
     success = managed.split(pathlib.Path('catalog.json'), ['catalog.metadata'])
     assert success
-    assert pathlib.Path(tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata.json').exists()
+    assert (tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata.json').exists()
 
     # test cwd is restored after splitting
     assert pathlib.Path.cwd() == cwd
 
     success = managed.split(pathlib.Path('catalog/metadata.json'), ['metadata.props'])
     assert success
-    assert pathlib.Path(tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata' / 'props.json').exists()
+    assert (tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata' / 'props.json').exists()
 
 
 def test_managed_split_multi(tmp_trestle_dir: pathlib.Path) -> None:
@@ -354,11 +354,11 @@ def test_managed_merge(tmp_trestle_dir: pathlib.Path) -> None:
     # split should be success
     success = managed.split(pathlib.Path('catalog.json'), ['catalog.metadata'])
     assert success
-    assert pathlib.Path(tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata.json').exists()
+    assert (tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata.json').exists()
 
     success = managed.split(pathlib.Path('catalog/metadata.json'), ['metadata.props'])
     assert success
-    assert pathlib.Path(tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata' / 'props.json').exists()
+    assert (tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata' / 'props.json').exists()
 
     # store current working directory before merge
     cwd = pathlib.Path.cwd()
@@ -366,11 +366,11 @@ def test_managed_merge(tmp_trestle_dir: pathlib.Path) -> None:
     # merge should be success
     success = managed.merge(['metadata.*'], pathlib.Path('catalog'))
     assert success
-    assert not pathlib.Path(tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata' / 'props.json').exists()
+    assert not (tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata' / 'props.json').exists()
 
     success = managed.merge(['catalog.*'])
     assert success
-    assert not pathlib.Path(tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata.json').exists()
+    assert not (tmp_trestle_dir / 'catalogs' / 'imported' / 'catalog' / 'metadata.json').exists()
 
     # test cwd is restored after splitting
     assert pathlib.Path.cwd() == cwd
@@ -17,6 +17,7 @@
 
 import datetime
 import pathlib
+from uuid import uuid4
 
 import pytest
 
@@ -24,7 +25,10 @@ from ruamel.yaml import YAML
 from ruamel.yaml.parser import ParserError
 
 import trestle.common.const as const
+import trestle.oscal.assessment_plan as ap
+import trestle.oscal.common as common
 import trestle.oscal.component as component
+from trestle.core.base_model import OscalBaseModel
 
 yaml_path = pathlib.Path('tests/data/yaml/')
 json_path = pathlib.Path('tests/data/json/')
@@ -113,3 +117,48 @@ def test_oscal_model(tmp_path: pathlib.Path) -> None:
         assert True
     else:
         assert AssertionError()
+
+
+@pytest.mark.parametrize(
+    'value',
+    [
+        '2020-01-01T00:00:00Z',
+        '2021-06-08T13:57:28.355446-04:00',
+        '2021-06-08T13:57:28.355-04:00',
+        '2020-01-01T00:00:00-00:00',
+        '2020-01-01 10:11',
+        '2020-01-01T00:00:00.1Z',
+        '2020-1-1T00:00:00Z',
+        '2020-01-01T00:00:00+0530',
+        1600000000,
+    ]
+)
+def test_oscal_datetime_fast_path(value) -> None:
+    """Test iso datetime fast path gives the same result as pydantic datetime parsing."""
+
+    class GenericEntry(OscalBaseModel):
+        start: datetime.datetime
+
+    expected = GenericEntry(start=value).start
+    entry = ap.Entry(uuid=str(uuid4()), title='title', start=value)
+    last_modified = common.LastModified(__root__=value)
+    for parsed in [entry.start, last_modified.__root__]:
+        assert parsed == expected
+        assert parsed.tzinfo == expected.tzinfo
+
+
+@pytest.mark.parametrize(
+    'value', ['2020-01-01', '2020-01-01T25:00:00Z', '2020-01-01T10:00:00+05:30:15', '2020-W01-1T10:00:00', 'junk']
+)
+def test_oscal_datetime_fast_path_rejects(value) -> None:
+    """Test strings that pydantic rejects are still rejected."""
+
+    class GenericEntry(OscalBaseModel):
+        start: datetime.datetime
+
+    with pytest.raises(ValueError):
+        GenericEntry(start=value)
+    with pytest.raises(ValueError):
+        ap.Entry(uuid=str(uuid4()), title='title', start=value)
+    with pytest.raises(ValueError):
+        common.LastModified(__root__=value)
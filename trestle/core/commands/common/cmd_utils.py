@@ -14,9 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Trestle command related utilities."""
+import inspect
 import pathlib
 from typing import Any, List, Optional, Type, Union
 
+from pydantic import ConstrainedStr
+
 from trestle.common import const, str_utils, type_utils
 from trestle.common.err import TrestleError
 from trestle.common.model_utils import ModelUtils
@@ -34,6 +37,8 @@ def model_type_is_too_granular(model_type: Type[Any]) -> bool:
         return True
     if model_type.__name__ in ['str', 'ConstrainedStrValue', 'int', 'float', 'datetime']:
         return True
+    if inspect.isclass(model_type) and issubclass(model_type, ConstrainedStr):
+        return True
     return False
 
 
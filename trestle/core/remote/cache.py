@@ -19,8 +19,11 @@ Trestle cache operations library.
 Allows for using URI's to reference external directories and then expand.
 """
 
+import atexit
 import datetime
+import functools
 import getpass
+import hashlib
 import logging
 import os
 import pathlib
@@ -29,7 +32,7 @@ import re
 from abc import ABC, abstractmethod
 from enum import Enum
 from io import StringIO
-from typing import Any, Dict, Tuple, Type
+from typing import Any, Dict, Optional, Tuple, Type
 from urllib import parse
 
 import paramiko
@@ -218,6 +221,8 @@ class HTTPSFetcher(FetcherBase):
         self._password = None
         u = parse.urlparse(self._uri)
         self._url = uri
+        if not u.hostname:
+            raise TrestleError(f'Cache request for invalid input URI: missing hostname {self._uri}')
         # If the either the username or password is omitted in the URI, then the other becomes ''
         # so we test for either None or ''.
         if u.username != '' and u.username is not None:
@@ -260,8 +265,8 @@ class HTTPSFetcher(FetcherBase):
         # Skip any number of back- or forward slashes preceding the URI path (u.path)
         path_parent = pathlib.Path(u.path[re.search('[^/\\\\]', u.path).span()[0]:]).parent
         https_cached_dir = https_cached_dir / path_parent
-        https_cached_dir.mkdir(parents=True, exist_ok=True)
-        self._cached_object_path = https_cached_dir / pathlib.Path(pathlib.Path(u.path).name)
+        os.makedirs(https_cached_dir, exist_ok=True)
+        self._cached_object_path = https_cached_dir / pathlib.Path(u.path).name
 
     def _do_fetch(self) -> None:
         auth = None
@@ -297,6 +302,11 @@ class HTTPSFetcher(FetcherBase):
 class SFTPFetcher(FetcherBase):
     """Fetcher for SFTP content."""
 
+    # Connected SSH clients shared by all SFTP fetchers, keyed by (hostname, username, port, credential digest).
+    _ssh_clients: Dict[Tuple[str, str, int, str], paramiko.SSHClient] = {}
+    # Oldest pooled connection is closed once this many are open.
+    _max_ssh_clients = 8
+
     def __init__(self, trestle_root: pathlib.Path, uri: str) -> None:
         """Initialize SFTP fetcher. Update the expected cache path as per caching specs.
 
@@ -326,16 +336,34 @@ class SFTPFetcher(FetcherBase):
         # Skip any number of back- or forward slashes preceding the URL path (u.path)
         path_parent = pathlib.Path(u.path[re.search('[^/\\\\]', u.path).span()[0]:]).parent
         sftp_cached_dir = sftp_cached_dir / path_parent
-        sftp_cached_dir.mkdir(parents=True, exist_ok=True)
-        self._cached_object_path = sftp_cached_dir / pathlib.Path(pathlib.Path(u.path).name)
+        os.makedirs(sftp_cached_dir, exist_ok=True)
+        self._cached_object_path = sftp_cached_dir / pathlib.Path(u.path).name
 
-    def _do_fetch(self) -> None:
-        """Fetch remote object and update the cache if appropriate and possible to do so.
+    @staticmethod
+    def _credential_digest(password: Optional[str], ssh_key: Optional[str]) -> str:
+        """Digest connection credentials, so a pooled client is only reused with the credentials it was opened with."""
+        credentials = f'{password or ""}\0{ssh_key or ""}'
+        return hashlib.sha256(credentials.encode(const.FILE_ENCODING)).hexdigest()
 
-        Authentication relies on the user's private key being either active via ssh-agent or
-        supplied via environment variable SSH_KEY. In the latter case, it must not require a passphrase prompt.
-        """
-        u = parse.urlparse(self._uri)
+    @classmethod
+    def close_ssh_clients(cls) -> None:
+        """Close and forget all pooled SSH clients."""
+        while cls._ssh_clients:
+            _, client = cls._ssh_clients.popitem()
+            client.close()
+
+    def _get_ssh_client(self, u: parse.ParseResult, username: str, port: int) -> paramiko.SSHClient:
+        """Return a connected SSH client for the host, reusing an active connection if one is pooled."""
+        ssh_key = os.environ.get('SSH_KEY')
+        key = (u.hostname, username, port, SFTPFetcher._credential_digest(u.password, ssh_key))
+        client = SFTPFetcher._ssh_clients.pop(key, None)
+        if client is not None:
+            transport = client.get_transport()
+            if transport is not None and transport.is_active():
+                # re-insert as most recently used
+                SFTPFetcher._ssh_clients[key] = client
+                return client
+            client.close()
         client = paramiko.SSHClient()
         # Must pick up host keys from the default known_hosts on this environment:
         try:
@@ -343,14 +371,13 @@ class SFTPFetcher(FetcherBase):
         except Exception as e:
             raise TrestleError(f'Cache update failure for {self._uri}: {e}.')
         # Use the supplied private key file if given, or look for keys in default path.
-        if 'SSH_KEY' in os.environ:
-            pkey = paramiko.RSAKey.from_private_key(StringIO(os.environ['SSH_KEY']))
+        if ssh_key is not None:
+            pkey = paramiko.RSAKey.from_private_key(StringIO(ssh_key))
             look_for_keys = False
         else:
             pkey = None
             look_for_keys = True
 
-        username = getpass.getuser() if not u.username else u.username
         try:
             client.connect(
                 u.hostname,
@@ -358,10 +385,26 @@ class SFTPFetcher(FetcherBase):
                 password=u.password,
                 pkey=pkey,
                 look_for_keys=look_for_keys,
-                port=22 if not u.port else u.port,
+                port=port,
             )
         except Exception as e:
             raise TrestleError(f'Cache update failure to connect via SSH: {u.hostname}: {e}.')
+        if len(SFTPFetcher._ssh_clients) >= SFTPFetcher._max_ssh_clients:
+            oldest = next(iter(SFTPFetcher._ssh_clients))
+            SFTPFetcher._ssh_clients.pop(oldest).close()
+        SFTPFetcher._ssh_clients[key] = client
+        return client
+
+    def _do_fetch(self) -> None:
+        """Fetch remote object and update the cache if appropriate and possible to do so.
+
+        Authentication relies on the user's private key being either active via ssh-agent or
+        supplied via environment variable SSH_KEY. In the latter case, it must not require a passphrase prompt.
+        The SSH connection is kept open and reused by later fetches with the same host, user, port and credentials.
+        """
+        u = parse.urlparse(self._uri)
+        username = getpass.getuser() if not u.username else u.username
+        client = self._get_ssh_client(u, username, 22 if not u.port else u.port)
 
         try:
             sftp_client = client.open_sftp()
@@ -370,9 +413,15 @@ class SFTPFetcher(FetcherBase):
 
         localpath = self._cached_object_path
         try:
-            sftp_client.get(remotepath=u.path[1:], localpath=(localpath.__str__()))
+            sftp_client.get(remotepath=u.path[1:], localpath=str(localpath))
         except Exception as e:
             raise TrestleError(f'Error getting remote resource {self._uri} into cache {localpath}: {e}')
+        finally:
+            sftp_client.close()
+
+
+# pooled ssh connections outlive individual fetches, so close them when the process exits
+atexit.register(SFTPFetcher.close_ssh_clients)
 
 
 # For passing variables:
@@ -393,15 +442,39 @@ class FetcherFactory:
 
         TRESTLE = 4
 
+    # uri schemes with a dedicated fetcher, keyed by the text preceding ://
+    _scheme_uri_types: Dict[str, UriType] = {
+        const.SFTP_URI[:-3]: UriType.SFTP,
+        const.HTTPS_URI[:-3]: UriType.HTTPS,
+        const.TRESTLE_HREF_HEADING[:-3]: UriType.TRESTLE,
+    }
+
+    _fetcher_types: Dict[UriType, Type[FetcherBase]] = {
+        UriType.LOCAL_FILE: LocalFetcher,
+        UriType.SFTP: SFTPFetcher,
+        UriType.HTTPS: HTTPSFetcher,
+        UriType.TRESTLE: LocalFetcher,
+    }
+
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _get_uri_type(uri: str) -> UriType:
-        """Determine the type of uri."""
-        if uri.startswith(const.SFTP_URI):
-            return FetcherFactory.UriType.SFTP
-        if uri.startswith(const.HTTPS_URI):
-            return FetcherFactory.UriType.HTTPS
-        if uri.startswith(const.TRESTLE_HREF_HEADING):
-            return FetcherFactory.UriType.TRESTLE
+        """Determine the type of uri.
+
+        The type depends only on the uri string, so results are memoized. Invalid uris raise and are not cached.
+        """
+        scheme, sep, remainder = uri.partition('://')
+        if sep and scheme in FetcherFactory._scheme_uri_types:
+            uri_type = FetcherFactory._scheme_uri_types[scheme]
+            # reject remote uris with no host or with windows separators before building a fetcher
+            if uri_type in (FetcherFactory.UriType.SFTP, FetcherFactory.UriType.HTTPS):
+                # only the authority and path are checked, a query or fragment may hold any character
+                location = re.split('[?#]', remainder, maxsplit=1)[0]
+                if not location or location[0] == '/' or '\\' in location:
+                    raise TrestleError(f'Cache request for invalid input URI: missing hostname or bad path {uri}')
+                if not location.partition('/')[2].strip('/'):
+                    raise TrestleError(f'Cache request for invalid input URI: missing file path {uri}')
+            return uri_type
         # if we land here, assume it is a local file and may have relative path
         # but it at least needs a filename with suffix
         # the most minimal allowed uri is of the form a.yml
@@ -437,11 +510,5 @@ class FetcherFactory:
         Returns:
             fetcher object for the given URI.
         """
-        fetcher_dict = {
-            FetcherFactory.UriType.LOCAL_FILE: LocalFetcher,
-            FetcherFactory.UriType.SFTP: SFTPFetcher,
-            FetcherFactory.UriType.HTTPS: HTTPSFetcher,
-            FetcherFactory.UriType.TRESTLE: LocalFetcher,
-        }
         uri_type = cls._get_uri_type(uri)
-        return fetcher_dict[uri_type](trestle_root, uri)
+        return cls._fetcher_types[uri_type](trestle_root, uri)
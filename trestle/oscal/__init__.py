@@ -17,3 +17,11 @@
 #TODO: Ensure this is automatically updated successfully.
 OSCAL_VERSION = '1.0.2'
 OSCAL_VERSION_REGEX = r'^1\.0\.[02]$'
+
+# patterns shared by constrained string fields across the oscal models
+UUID_REGEX = r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
+NCNAME_REGEX = (
+    r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD]'
+    r'[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
+)
+NON_SPACE_REGEX = r'^\S(.*\S)?$'
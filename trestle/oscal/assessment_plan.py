@@ -41,9 +41,6 @@ class TermsAndConditions(OscalBaseModel):
     Used to define various terms and conditions under which an assessment, described by the plan, can be performed. Each child part defines a different type of term or condition.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     parts: Optional[List[common.AssessmentPart]] = Field(None)
 
 
@@ -72,18 +69,12 @@ class Status(OscalBaseModel):
     A determination of if the objective is satisfied or not within a given system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     state: State = Field(
         ...,
         description='An indication as to whether the objective is satisfied or not.',
         title='Objective Status State',
     )
-    reason: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    reason: Optional[common.NCNameStr] = Field(
         None,
         description="The reason the objective was given it's status.",
         title='Objective Status Reason',
@@ -96,13 +87,7 @@ class SelectControlById(OscalBaseModel):
     Used to select a control for inclusion/exclusion based on one or more control identifiers. A set of statement identifiers can be used to target the inclusion/exclusion to only specific control statements providing more granularity over the specific statements that are within the asessment scope.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    control_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    control_id: common.NCNameStr = Field(
         ...,
         alias='control-id',
         description=
@@ -117,12 +102,7 @@ class RelatedObservation(OscalBaseModel):
     Relates the finding to a set of referenced observations that were used to determine the finding.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    observation_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    observation_uuid: common.UUIDStr = Field(
         ...,
         alias='observation-uuid',
         description='A machine-oriented identifier reference to an observation defined in the list of observations.',
@@ -135,15 +115,12 @@ class Origin(OscalBaseModel):
     Identifies the source of the finding, such as a tool, interviewed person, or activity.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     actors: List[common.OriginActor] = Field(...)
     related_tasks: Optional[List[common.RelatedTask]] = Field(None, alias='related-tasks')
 
 
 class Method(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$') = Field(
+    __root__: common.NonSpaceStr = Field(
         ...,
         description='Identifies how the observation was made.',
         title='Observation Method',
@@ -155,12 +132,7 @@ class Observation(OscalBaseModel):
     Describes an individual observation.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this observation elsewhere in this or other OSCAL instances. The locally defined UUID of the observation can be used to reference the data item locally or globally (e.g., in an imorted OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -192,18 +164,17 @@ class Observation(OscalBaseModel):
     )
     remarks: Optional[common.Remarks] = None
 
+    @validator('collected', 'expires', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return common.parse_iso_datetime(v)
+
 
 class Entry(OscalBaseModel):
     """
     Identifies an individual risk response that occurred as part of managing an identified risk.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this risk log entry elsewhere in this or other OSCAL instances. The locally defined UUID of the risk log entry can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -233,15 +204,16 @@ class Entry(OscalBaseModel):
     related_responses: Optional[List[common.RelatedResponse]] = Field(None, alias='related-responses')
     remarks: Optional[common.Remarks] = None
 
+    @validator('start', 'end', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return common.parse_iso_datetime(v)
+
 
 class ControlSelection(OscalBaseModel):
     """
     Identifies the controls being assessed. In the assessment plan, these are the planned controls. In the assessment results, these are the actual controls, and reflects any changes from the plan.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: Optional[str] = Field(
         None,
         description='A human-readable description of in-scope controls specified for assessment.',
@@ -260,9 +232,6 @@ class Characterization(OscalBaseModel):
     A collection of descriptive data about the containing object from a specific origin.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
     origin: Origin
@@ -274,9 +243,6 @@ class Status1(OscalBaseModel):
     Describes the operational status of the system component.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     state: State1 = Field(..., description='The operational status.', title='State')
     remarks: Optional[common.Remarks] = None
 
@@ -286,18 +252,13 @@ class SystemComponent(OscalBaseModel):
     A defined component that can be part of an implemented system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this component elsewhere in this or other OSCAL instances. The locally defined UUID of the component can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Component Identifier',
     )
-    type: constr(regex=r'^\S(.*\S)?$') = Field(
+    type: common.NonSpaceStr = Field(
         ...,
         description='A category describing the purpose of the component.',
         title='Component Type',
@@ -328,15 +289,16 @@ class SystemComponent(OscalBaseModel):
     protocols: Optional[List[common.Protocol]] = Field(None)
     remarks: Optional[common.Remarks] = None
 
+    @validator('type', pre=True)
+    def intern_vocabulary(cls, v):
+        return common.intern_str(v)
+
 
 class RiskLog(OscalBaseModel):
     """
     A log of all risk-related tasks taken.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     entries: List[Entry] = Field(...)
 
 
@@ -345,9 +307,6 @@ class ReviewedControls(OscalBaseModel):
     Identifies the controls being assessed and their control objectives.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: Optional[str] = Field(
         None,
         description='A human-readable description of control objectives.',
@@ -367,21 +326,13 @@ class Response(OscalBaseModel):
     Describes either recommended or an actual plan for addressing the risk.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this remediation elsewhere in this or other OSCAL instances. The locally defined UUID of the risk response can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Remediation Universally Unique Identifier',
     )
-    lifecycle: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    lifecycle: common.NCNameStr = Field(
         ...,
         description=
         'Identifies whether this is a recommendation, such as from an assessor or tool, or an actual plan accepted by the system owner.',
@@ -400,18 +351,17 @@ class Response(OscalBaseModel):
     tasks: Optional[List[common.Task]] = Field(None)
     remarks: Optional[common.Remarks] = None
 
+    @validator('lifecycle', pre=True)
+    def intern_vocabulary(cls, v):
+        return common.intern_str(v)
+
 
 class Risk(OscalBaseModel):
     """
     An identified risk.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this risk elsewhere in this or other OSCAL instances. The locally defined UUID of the risk can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -450,15 +400,16 @@ class Risk(OscalBaseModel):
     )
     related_observations: Optional[List[RelatedObservation]] = Field(None, alias='related-observations')
 
+    @validator('deadline', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return common.parse_iso_datetime(v)
+
 
 class AssessmentAssets(OscalBaseModel):
     """
     Identifies the assets used to perform this assessment, such as the assessment team, scanning tools, and assumptions.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     components: Optional[List[SystemComponent]] = Field(None)
     assessment_platforms: List[common.AssessmentPlatform] = Field(..., alias='assessment-platforms')
 
@@ -468,12 +419,7 @@ class Step(OscalBaseModel):
     Identifies an individual step in a series of steps related to an activity, such as an assessment test or examination procedure.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this step elsewhere in this or other OSCAL instances. The locally defined UUID of the step (in a series of steps) can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -497,12 +443,7 @@ class Activity(OscalBaseModel):
     Identifies an assessment or related process that can be performed. In the assessment plan, this is an intended activity which may be associated with an assessment task. In the assessment results, this an activity that was actually performed as part of an assessment.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this assessment activity elsewhere in this or other OSCAL instances. The locally defined UUID of the activity can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -531,9 +472,6 @@ class LocalDefinitions(OscalBaseModel):
     Used to define data objects that are used in the assessment plan, that do not appear in the referenced SSP.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     components: Optional[List[SystemComponent]] = Field(None)
     inventory_items: Optional[List[common.InventoryItem]] = Field(None, alias='inventory-items')
     users: Optional[List[common.SystemUser]] = Field(None)
@@ -547,12 +485,7 @@ class AssessmentPlan(OscalBaseModel):
     An assessment plan, such as those provided by a FedRAMP assessor.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this assessment plan in this or other OSCAL instances. The locally defined UUID of the assessment plan can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -25,19 +25,97 @@
 from __future__ import annotations
 
 import re
+import sys
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import AnyUrl, EmailStr, Extra, Field, conint, constr, validator
+from pydantic import AnyUrl, ConstrainedStr, EmailStr, Extra, Field, conint, constr, errors, validator
+from pydantic.validators import str_validator
 
 from trestle.core.base_model import OscalBaseModel
-from trestle.oscal import OSCAL_VERSION_REGEX, OSCAL_VERSION
+from trestle.oscal import OSCAL_VERSION_REGEX, OSCAL_VERSION, NCNAME_REGEX, NON_SPACE_REGEX, UUID_REGEX
+
+
+class _PatternStr(ConstrainedStr):
+    """
+    Constrained string checked against a precompiled pattern without the generic constr validator chain.
+    """
+
+    @classmethod
+    def __get_validators__(cls):
+        yield str_validator
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        if cls.regex.match(value) is None:
+            raise errors.StrRegexError(pattern=cls.regex.pattern)
+        return value
+
+
+UUID_RE = re.compile(UUID_REGEX)
+
+
+class UUIDStr(_PatternStr):
+    regex = UUID_RE
+
+
+NCNAME_RE = re.compile(NCNAME_REGEX)
+
+
+class NCNameStr(_PatternStr):
+    regex = NCNAME_RE
+
+
+NON_SPACE_RE = re.compile(NON_SPACE_REGEX)
+
+
+class NonSpaceStr(_PatternStr):
+    """
+    String with no leading or trailing whitespace and no embedded newline.
+
+    Checked directly with the same result as NON_SPACE_RE.match, which also allows a single trailing newline.
+    """
+
+    regex = NON_SPACE_RE
+
+    @classmethod
+    def validate(cls, value: str) -> str:
+        stripped = value[:-1] if value.endswith('\n') else value
+        if not stripped or stripped[0].isspace() or stripped[-1].isspace() or '\n' in stripped:
+            raise errors.StrRegexError(pattern=cls.regex.pattern)
+        return value
+
+
+ISO_DATETIME_RE = re.compile(
+    r'[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}(:[0-9]{2}(\.[0-9]{3}|\.[0-9]{6})?)?(Z|[+-][0-9]{2}:[0-9]{2})?'
+)
+
+
+def parse_iso_datetime(value: Any) -> Any:
+    """
+    Parse a datetime string with datetime.fromisoformat when pydantic would parse it to the same value.
+
+    Anything else is returned unchanged for pydantic's own datetime parsing, which also reports the errors.
+    """
+    if isinstance(value, str) and ISO_DATETIME_RE.fullmatch(value):
+        try:
+            return datetime.fromisoformat(value[:-1] + '+00:00' if value[-1] == 'Z' else value)
+        except ValueError:
+            pass
+    return value
+
+
+def intern_str(value: Any) -> Any:
+    """
+    Intern a string drawn from a small closed vocabulary so repeated values share one object.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 class AddrLine(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$'
-                     ) = Field(..., description='A single line of an address.', title='Address line')
+    __root__: NonSpaceStr = Field(..., description='A single line of an address.', title='Address line')
 
 
 class Address(OscalBaseModel):
@@ -45,33 +123,25 @@ class Address(OscalBaseModel):
     A postal address for the location.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    type: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
-        None, description='Indicates the type of address.', title='Address Type'
-    )
+    type: Optional[NCNameStr] = Field(None, description='Indicates the type of address.', title='Address Type')
     addr_lines: Optional[List[AddrLine]] = Field(None, alias='addr-lines')
-    city: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    city: Optional[NonSpaceStr] = Field(
         None,
         description='City, town or geographical region for the mailing address.',
         title='City',
     )
-    state: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    state: Optional[NonSpaceStr] = Field(
         None,
         description='State, province or analogous geographical region for mailing address',
         title='State',
     )
-    postal_code: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    postal_code: Optional[NonSpaceStr] = Field(
         None,
         alias='postal-code',
         description='Postal or ZIP code for mailing address',
         title='Postal Code',
     )
-    country: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    country: Optional[NonSpaceStr] = Field(
         None,
         description='The ISO 3166-1 alpha-2 country code for the mailing address.',
         title='Country Code',
@@ -83,9 +153,6 @@ class WithinDateRange(OscalBaseModel):
     The task is intended to occur within the specified date range.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     start: datetime = Field(
         ...,
         description='The task must occur on or after the specified date.',
@@ -97,9 +164,13 @@ class WithinDateRange(OscalBaseModel):
         title='End Date Condition',
     )
 
+    @validator('start', 'end', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return parse_iso_datetime(v)
+
 
 class Version(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$') = Field(
+    __root__: NonSpaceStr = Field(
         ...,
         description=
         'A string used to distinguish the current version of the document from other previous (and future) versions.',
@@ -108,8 +179,7 @@ class Version(OscalBaseModel):
 
 
 class Value(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$'
-                     ) = Field(..., description='A parameter value or set of values.', title='Parameter Value')
+    __root__: NonSpaceStr = Field(..., description='A parameter value or set of values.', title='Parameter Value')
 
 
 class Unit(Enum):
@@ -136,10 +206,7 @@ class Type3(Enum):
 
 
 class Type2(OscalBaseModel):
-    __root__: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    __root__: NCNameStr = Field(
         ...,
         description=
         'Identifies the nature of the observation. More than one may be used to further qualify and enable filtering.',
@@ -179,9 +246,6 @@ class ThreatId(OscalBaseModel):
     A pointer, by ID, to an externally-defined threat.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     system: AnyUrl = Field(
         ...,
         description='Specifies the source of the threat information.',
@@ -200,12 +264,7 @@ class TelephoneNumber(OscalBaseModel):
     Contact number by telephone.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    type: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
-        None, description='Indicates the type of phone number.', title='type flag'
-    )
+    type: Optional[NonSpaceStr] = Field(None, description='Indicates the type of phone number.', title='type flag')
     number: str
 
 
@@ -214,9 +273,6 @@ class SystemId(OscalBaseModel):
     A human-oriented, globally unique identifier with cross-instance scope that can be used to reference this system identification property elsewhere in this or other OSCAL instances. When referencing an externally defined system identification, the system identification must be used in the context of the external / imported OSCAL instance (e.g., uri-reference). This string should be assigned per-subject, which means it should be consistently used to identify the same system across revisions of the document.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     identifier_type: Optional[AnyUrl] = Field(
         None,
         alias='identifier-type',
@@ -227,10 +283,7 @@ class SystemId(OscalBaseModel):
 
 
 class StatementId(OscalBaseModel):
-    __root__: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    __root__: NCNameStr = Field(
         ...,
         description='Used to constrain the selection to only specificity identified statements.',
         title='Include Specific Statements',
@@ -242,12 +295,7 @@ class Source(OscalBaseModel):
     Assessment subjects will be identified while conducting the referenced activity-instance.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    task_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    task_uuid: UUIDStr = Field(
         ...,
         alias='task-uuid',
         description=
@@ -261,13 +309,7 @@ class SelectObjectiveById(OscalBaseModel):
     Used to select a control objective for inclusion/exclusion based on the control objective's identifier.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    objective_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    objective_id: NCNameStr = Field(
         ...,
         alias='objective-id',
         description='Points to an assessment objective.',
@@ -276,10 +318,7 @@ class SelectObjectiveById(OscalBaseModel):
 
 
 class RoleId(OscalBaseModel):
-    __root__: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    __root__: NCNameStr = Field(
         ...,
         description='A human-oriented identifier reference to roles served by the user.',
         title='Role Identifier Reference',
@@ -287,10 +326,7 @@ class RoleId(OscalBaseModel):
 
 
 class RiskStatus(OscalBaseModel):
-    __root__: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    __root__: NCNameStr = Field(
         ...,
         description='Describes the status of the associated risk.',
         title='Risk Status',
@@ -310,16 +346,12 @@ class RelatedRisk(OscalBaseModel):
     Relates the finding to a set of referenced risks that were used to determine the finding.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    risk_uuid: constr(regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-                      ) = Field(
-                          ...,
-                          alias='risk-uuid',
-                          description='A machine-oriented identifier reference to a risk defined in the list of risks.',
-                          title='Risk Universally Unique Identifier Reference',
-                      )
+    risk_uuid: UUIDStr = Field(
+        ...,
+        alias='risk-uuid',
+        description='A machine-oriented identifier reference to a risk defined in the list of risks.',
+        title='Risk Universally Unique Identifier Reference',
+    )
 
 
 class RelatedObservation1(OscalBaseModel):
@@ -327,12 +359,7 @@ class RelatedObservation1(OscalBaseModel):
     Relates the finding to a set of referenced observations that were used to determine the finding.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    observation_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    observation_uuid: UUIDStr = Field(
         ...,
         alias='observation-uuid',
         description='A machine-oriented identifier reference to an observation defined in the list of observations.',
@@ -348,27 +375,23 @@ class Published(OscalBaseModel):
         title='Publication Timestamp',
     )
 
+    @validator('__root__', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return parse_iso_datetime(v)
+
 
 class Property(OscalBaseModel):
     """
     An attribute, characteristic, or quality of the containing object expressed as a namespace qualified name/value pair. The value of a property is a simple scalar value, which may be expressed as a list of values.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    name: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    name: NCNameStr = Field(
         ...,
         description=
         "A textual label that uniquely identifies a specific attribute, characteristic, or quality of the property's containing object.",
         title='Property Name',
     )
-    uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    uuid: Optional[UUIDStr] = Field(
         None,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this defined property elsewhere in this or other OSCAL instances. This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -380,15 +403,12 @@ class Property(OscalBaseModel):
         "A namespace qualifying the property's name. This allows different organizations to associate distinct semantics with the same name.",
         title='Property Namespace',
     )
-    value: constr(regex=r'^\S(.*\S)?$') = Field(
+    value: NonSpaceStr = Field(
         ...,
         description='Indicates the value of the attribute, characteristic, or quality.',
         title='Property Value',
     )
-    class_: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    class_: Optional[NCNameStr] = Field(
         None,
         alias='class',
         description=
@@ -403,9 +423,6 @@ class PortRange(OscalBaseModel):
     Where applicable this is the IPv4 port range on which the service operates.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     start: Optional[conint(ge=0, multiple_of=1)] = Field(
         None,
         description='Indicates the starting port number in a port range',
@@ -424,18 +441,13 @@ class Protocol(OscalBaseModel):
     Information about the protocol used to provide a service.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    uuid: Optional[UUIDStr] = Field(
         None,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this service protocol information elsewhere in this or other OSCAL instances. The locally defined UUID of the service protocol can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Service Protocol Information Universally Unique Identifier',
     )
-    name: constr(regex=r'^\S(.*\S)?$') = Field(
+    name: NonSpaceStr = Field(
         ...,
         description=
         'The common name of the protocol, which should be the appropriate "service name" from the IANA Service Name and Transport Protocol Port Number Registry.',
@@ -450,9 +462,7 @@ class Protocol(OscalBaseModel):
 
 
 class PartyUuid(OscalBaseModel):
-    __root__: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    __root__: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented identifier reference to another party defined in metadata. The UUID of the party in the source OSCAL instance is sufficient to reference the data item locally or globally (e.g., in an imported OSCAL instance).',
@@ -461,8 +471,7 @@ class PartyUuid(OscalBaseModel):
 
 
 class ParameterValue(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$'
-                     ) = Field(..., description='A parameter value or set of values.', title='Parameter Value')
+    __root__: NonSpaceStr = Field(..., description='A parameter value or set of values.', title='Parameter Value')
 
 
 class ParameterGuideline(OscalBaseModel):
@@ -470,9 +479,6 @@ class ParameterGuideline(OscalBaseModel):
     A prose statement that provides a recommendation for the use of a parameter.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     prose: str = Field(
         ...,
         description='Prose permits multiple paragraphs, lists, tables etc.',
@@ -481,7 +487,7 @@ class ParameterGuideline(OscalBaseModel):
 
 
 class OscalVersion(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$') = Field(
+    __root__: NonSpaceStr = Field(
         ...,
         description='The OSCAL model version the document was authored against.',
         title='OSCAL version',
@@ -501,20 +507,19 @@ class OnDate(OscalBaseModel):
     The task is intended to occur on the specified date.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     date: datetime = Field(
         ...,
         description='The task must occur on the specified date.',
         title='On Date Condition',
     )
 
+    @validator('date', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return parse_iso_datetime(v)
+
 
 class MemberOfOrganization(OscalBaseModel):
-    __root__: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    __root__: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented identifier reference to another party (person or organization) that this subject is associated with. The UUID of the party in the source OSCAL instance is sufficient to reference the data item locally or globally (e.g., in an imported OSCAL instance).',
@@ -527,21 +532,13 @@ class LoggedBy(OscalBaseModel):
     Used to indicate who created a log entry in what role.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    party_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    party_uuid: UUIDStr = Field(
         ...,
         alias='party-uuid',
         description='A machine-oriented identifier reference to the party who is making the log entry.',
         title='Party UUID Reference',
     )
-    role_id: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    role_id: Optional[NCNameStr] = Field(
         None,
         alias='role-id',
         description='A point to the role-id of the role in which the party is making the log entry.',
@@ -550,9 +547,7 @@ class LoggedBy(OscalBaseModel):
 
 
 class LocationUuid(OscalBaseModel):
-    __root__: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    __root__: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented identifier reference to a location defined in the metadata section of this or another OSCAL instance. The UUID of the location in the source OSCAL instance is sufficient to reference the data item locally or globally (e.g., in an imported OSCAL instance).',
@@ -565,24 +560,18 @@ class Link(OscalBaseModel):
     A reference to a local or remote resource
     """
 
-    class Config:
-        extra = Extra.forbid
-
     href: str = Field(
         ...,
         description='A resolvable URL reference to a resource.',
         title='Hypertext Reference',
     )
-    rel: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    rel: Optional[NCNameStr] = Field(
         None,
         description=
         "Describes the type of relationship provided by the link. This can be an indicator of the link's purpose.",
         title='Relation',
     )
-    media_type: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    media_type: Optional[NonSpaceStr] = Field(
         None,
         alias='media-type',
         description=
@@ -604,6 +593,10 @@ class LastModified(OscalBaseModel):
         title='Last Modified Timestamp',
     )
 
+    @validator('__root__', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return parse_iso_datetime(v)
+
 
 class IncludeAll(OscalBaseModel):
     """
@@ -612,18 +605,12 @@ class IncludeAll(OscalBaseModel):
 
     pass
 
-    class Config:
-        extra = Extra.forbid
-
 
 class ImportSsp(OscalBaseModel):
     """
     Used by the assessment plan and POA&M to import information about the system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     href: str = Field(
         ...,
         description='A resolvable URL reference to the system security plan for the system being assessed.',
@@ -637,13 +624,7 @@ class ImplementationStatus(OscalBaseModel):
     Indicates the degree to which the a given control is implemented.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    state: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    state: NCNameStr = Field(
         ...,
         description='Identifies the implementation status of the control or control objective.',
         title='Implementation State',
@@ -665,16 +646,12 @@ class Hash(OscalBaseModel):
     A representation of a cryptographic digest generated over a resource using a specified hash algorithm.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    algorithm: constr(regex=r'^\S(.*\S)?$'
-                      ) = Field(..., description='Method by which a hash is derived', title='Hash algorithm')
+    algorithm: NonSpaceStr = Field(..., description='Method by which a hash is derived', title='Hash algorithm')
     value: str
 
 
 class FunctionPerformed(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$') = Field(
+    __root__: NonSpaceStr = Field(
         ...,
         description='Describes a function performed for a given authorized privilege by this user class.',
         title='Functions Performed',
@@ -686,13 +663,7 @@ class Facet(OscalBaseModel):
     An individual characteristic that is part of a larger set produced by the same actor.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    name: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    name: NCNameStr = Field(
         ...,
         description='The name of the risk metric within the specified system.',
         title='Facet Name',
@@ -703,8 +674,7 @@ class Facet(OscalBaseModel):
         'Specifies the naming system under which this risk metric is organized, which allows for the same names to be used in different systems controlled by different parties. This avoids the potential of a name clash.',
         title='Naming System',
     )
-    value: constr(regex=r'^\S(.*\S)?$'
-                  ) = Field(..., description='Indicates the value of the facet.', title='Facet Value')
+    value: NonSpaceStr = Field(..., description='Indicates the value of the facet.', title='Facet Value')
     props: Optional[List[Property]] = Field(None)
     links: Optional[List[Link]] = Field(None)
     remarks: Optional[Remarks] = None
@@ -715,9 +685,6 @@ class ExternalId(OscalBaseModel):
     An identifier for a person or organization using a designated scheme. e.g. an Open Researcher and Contributor ID (ORCID)
     """
 
-    class Config:
-        extra = Extra.forbid
-
     scheme: AnyUrl = Field(
         ...,
         description='Indicates the type of external identifier.',
@@ -739,9 +706,6 @@ class DocumentId(OscalBaseModel):
     A document identifier qualified by an identifier scheme. A document identifier provides a globally unique identifier with a cross-instance scope that is used for a group of documents that are to be treated as different versions of the same document. If this element does not appear, or if the value of this element is empty, the value of "document-id" is equal to the value of the "uuid" flag of the top-level root element.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     scheme: Optional[AnyUrl] = Field(
         None,
         description=
@@ -756,16 +720,12 @@ class Dependency(OscalBaseModel):
     Used to indicate that a task is dependent on another task.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    task_uuid: constr(regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-                      ) = Field(
-                          ...,
-                          alias='task-uuid',
-                          description='A machine-oriented identifier reference to a unique task.',
-                          title='Task Universally Unique Identifier Reference',
-                      )
+    task_uuid: UUIDStr = Field(
+        ...,
+        alias='task-uuid',
+        description='A machine-oriented identifier reference to a unique task.',
+        title='Task Universally Unique Identifier Reference',
+    )
     remarks: Optional[Remarks] = None
 
 
@@ -774,9 +734,6 @@ class ControlObjectiveSelection(OscalBaseModel):
     Identifies the control objectives of the assessment. In the assessment plan, these are the planned objectives. In the assessment results, these are the assessed objectives, and reflects any changes from the plan.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: Optional[str] = Field(
         None,
         description='A human-readable description of this collection of control objectives.',
@@ -795,9 +752,6 @@ class Citation(OscalBaseModel):
     A citation consisting of end note text and optional structured bibliographic data.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     text: str = Field(..., description='A line of citation text.', title='Citation Text')
     props: Optional[List[Property]] = Field(None)
     links: Optional[List[Link]] = Field(None)
@@ -808,16 +762,13 @@ class Base64(OscalBaseModel):
     The Base64 alphabet in RFC 2045 - aligned with XSD.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     filename: Optional[str] = Field(
         None,
         description=
         'Name of the file before it was encoded as Base64 to be embedded in a resource. This is the name that will be assigned to the file when the file is decoded.',
         title='File Name',
     )
-    media_type: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    media_type: Optional[NonSpaceStr] = Field(
         None,
         alias='media-type',
         description=
@@ -832,9 +783,6 @@ class AuthorizedPrivilege(OscalBaseModel):
     Identifies a specific system privilege held by the user, along with an associated description and/or rationale for the privilege.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     title: str = Field(
         ...,
         description='A human readable name for the privilege.',
@@ -853,9 +801,6 @@ class AtFrequency(OscalBaseModel):
     The task is intended to occur at the specified frequency.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     period: conint(
         ge=1, multiple_of=1
     ) = Field(
@@ -871,12 +816,7 @@ class AssessmentSubjectPlaceholder(OscalBaseModel):
     Used when the assessment subjects will be determined as part of one or more other assessment activities. These assessment subjects will be recorded in the assessment results in the assessment log.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier for a set of assessment subjects that will be identified by a task or an activity that is part of a task. The locally defined UUID of the assessment subject placeholder can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -898,21 +838,13 @@ class AssessmentPart(OscalBaseModel):
     A partition of an assessment plan or results or a child of another part.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    uuid: Optional[UUIDStr] = Field(
         None,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this part elsewhere in this or other OSCAL instances. The locally defined UUID of the part can be used to reference the data item locally or globally (e.g., in an ported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Part Identifier',
     )
-    name: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    name: NCNameStr = Field(
         ...,
         description="A textual label that uniquely identifies the part's semantic type.",
         title='Part Name',
@@ -923,10 +855,7 @@ class AssessmentPart(OscalBaseModel):
         "A namespace qualifying the part's name. This allows different organizations to associate distinct semantics with the same name.",
         title='Part Namespace',
     )
-    class_: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    class_: Optional[NCNameStr] = Field(
         None,
         alias='class',
         description=
@@ -953,9 +882,6 @@ class Timing(OscalBaseModel):
     The timing under which the task is intended to occur.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     on_date: Optional[OnDate] = Field(
         None,
         alias='on-date',
@@ -981,10 +907,7 @@ class Test(OscalBaseModel):
     A test expression which is expected to be evaluated by a tool.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    expression: constr(regex=r'^\S(.*\S)?$') = Field(
+    expression: NonSpaceStr = Field(
         ...,
         description='A formal (executable) expression of a constraint',
         title='Constraint test',
@@ -997,9 +920,6 @@ class ParameterConstraint(OscalBaseModel):
     A formal or informal expression of a constraint or test
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: Optional[str] = Field(
         None,
         description='A textual summary of the constraint to be applied.',
@@ -1013,12 +933,7 @@ class SystemUser(OscalBaseModel):
     A type of user that interacts with the system based on an associated role.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this user class elsewhere in this or other OSCAL instances. The locally defined UUID of the system user can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -1029,7 +944,7 @@ class SystemUser(OscalBaseModel):
         description='A name given to the user, which may be used by a tool for display and navigation.',
         title='User Title',
     )
-    short_name: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    short_name: Optional[NonSpaceStr] = Field(
         None,
         alias='short-name',
         description='A short common name, abbreviation, or acronym for the user.',
@@ -1052,22 +967,14 @@ class SubjectReference(OscalBaseModel):
     A human-oriented identifier reference to a resource. Use type to indicate whether the identified resource is a component, inventory item, location, user, or something else.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    subject_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    subject_uuid: UUIDStr = Field(
         ...,
         alias='subject-uuid',
         description=
         "A machine-oriented identifier reference to a component, inventory-item, location, party, user, or resource using it's UUID.",
         title='Subject Universally Unique Identifier Reference',
     )
-    type: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    type: NCNameStr = Field(
         ...,
         description='Used to indicate the type of object pointed to by the uuid-ref within a subject.',
         title='Subject Universally Unique Identifier Reference Type',
@@ -1087,20 +994,13 @@ class MitigatingFactor(OscalBaseModel):
     Describes an existing mitigating factor that may affect the overall determination of the risk, with an optional link to an implementation statement in the SSP.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this mitigating factor elsewhere in this or other OSCAL instances. The locally defined UUID of the mitigating factor can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Mitigating Factor Universally Unique Identifier',
     )
-    implementation_uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    implementation_uuid: Optional[UUIDStr] = Field(
         None,
         alias='implementation-uuid',
         description=
@@ -1122,22 +1022,14 @@ class SelectSubjectById(OscalBaseModel):
     Identifies a set of assessment subjects to include/exclude by UUID.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    subject_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    subject_uuid: UUIDStr = Field(
         ...,
         alias='subject-uuid',
         description=
         "A machine-oriented identifier reference to a component, inventory-item, location, party, user, or resource using it's UUID.",
         title='Subject Universally Unique Identifier Reference',
     )
-    type: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    type: NCNameStr = Field(
         ...,
         description='Used to indicate the type of object pointed to by the uuid-ref within a subject.',
         title='Subject Universally Unique Identifier Reference Type',
@@ -1152,13 +1044,7 @@ class AssessmentSubject(OscalBaseModel):
     Identifies system elements being assessed, such as components, inventory items, and locations. In the assessment plan, this identifies a planned assessment subject. In the assessment results this is an actual assessment subject, and reflects any changes from the plan. exactly what will be the focus of this assessment. Any subjects not identified in this way are out-of-scope.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    type: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    type: NCNameStr = Field(
         ...,
         description=
         'Indicates the type of assessment subject, such as a component, inventory, item, location, or party represented by this selection statement.',
@@ -1182,13 +1068,7 @@ class Role(OscalBaseModel):
     Defines a function assumed or expected to be assumed by a party in a specific situation.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    id: NCNameStr = Field(
         ...,
         description=
         'A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined role elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, the locally defined ID of the Role from the imported OSCAL instance must be referenced in the context of the containing resource (e.g., import, import-component-definition, import-profile, import-ssp or import-ap). This ID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -1199,7 +1079,7 @@ class Role(OscalBaseModel):
         description='A name given to the role, which may be used by a tool for display and navigation.',
         title='Role Title',
     )
-    short_name: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    short_name: Optional[NonSpaceStr] = Field(
         None,
         alias='short-name',
         description='A short common name, abbreviation, or acronym for the role.',
@@ -1220,15 +1100,12 @@ class Rlink(OscalBaseModel):
     A pointer to an external resource with an optional hash for verification and change detection.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     href: str = Field(
         ...,
         description='A resolvable URI reference to a resource.',
         title='Hypertext Reference',
     )
-    media_type: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    media_type: Optional[NonSpaceStr] = Field(
         None,
         alias='media-type',
         description=
@@ -1243,12 +1120,7 @@ class Resource(OscalBaseModel):
     A resource associated with content in the containing document. A resource may be directly included in the document base64 encoded or may point to one or more equivalent internet resources.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this defined resource elsewhere in this or other OSCAL instances. This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -1285,9 +1157,6 @@ class BackMatter(OscalBaseModel):
     A collection of resources, which may be included directly or by reference.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     resources: Optional[List[Resource]] = Field(None)
 
 
@@ -1296,9 +1165,6 @@ class Revision(OscalBaseModel):
     An entry in a sequential list of revisions to the containing document in reverse chronological order (i.e., most recent previous revision first).
     """
 
-    class Config:
-        extra = Extra.forbid
-
     title: Optional[str] = Field(
         None,
         description='A name given to the document revision, which may be used by a tool for display and navigation.',
@@ -1318,13 +1184,7 @@ class ResponsibleRole(OscalBaseModel):
     A reference to one or more roles with responsibility for performing a function relative to the containing object.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    role_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    role_id: NCNameStr = Field(
         ...,
         alias='role-id',
         description='A human-oriented identifier reference to roles responsible for the business function.',
@@ -1341,13 +1201,7 @@ class ResponsibleParty(OscalBaseModel):
     A reference to a set of organizations or persons that have responsibility for performing a referenced role in the context of the containing object.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    role_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    role_id: NCNameStr = Field(
         ...,
         alias='role-id',
         description='A human-oriented identifier reference to roles served by the user.',
@@ -1364,12 +1218,7 @@ class RequiredAsset(OscalBaseModel):
     Identifies an asset required to achieve remediation.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this required asset elsewhere in this or other OSCAL instances. The locally defined UUID of the asset can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -1396,9 +1245,6 @@ class RelevantEvidence(OscalBaseModel):
     Links this observation to relevant evidence.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     href: Optional[str] = Field(
         None,
         description='A resolvable URL reference to relevant evidence.',
@@ -1419,12 +1265,7 @@ class Party(OscalBaseModel):
     A responsible entity which is either a person or an organization.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this defined party elsewhere in this or other OSCAL instances. The locally defined UUID of the party can be used to reference the data item locally or globally (e.g., from an importing OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -1435,12 +1276,12 @@ class Party(OscalBaseModel):
         description='A category describing the kind of party the object describes.',
         title='Party Type',
     )
-    name: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    name: Optional[NonSpaceStr] = Field(
         None,
         description='The full name of the party. This is typically the legal name associated with the party.',
         title='Party Name',
     )
-    short_name: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    short_name: Optional[NonSpaceStr] = Field(
         None,
         alias='short-name',
         description='A short common name, abbreviation, or acronym for the party.',
@@ -1462,22 +1303,13 @@ class Part(OscalBaseModel):
     A partition of a control's definition or a child of another part.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    id: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    id: Optional[NCNameStr] = Field(
         None,
         description=
         'A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined part elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Part Identifier',
     )
-    name: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    name: NCNameStr = Field(
         ...,
         description="A textual label that uniquely identifies the part's semantic type.",
         title='Part Name',
@@ -1488,10 +1320,7 @@ class Part(OscalBaseModel):
         "A namespace qualifying the part's name. This allows different organizations to associate distinct semantics with the same name.",
         title='Part Namespace',
     )
-    class_: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    class_: Optional[NCNameStr] = Field(
         None,
         alias='class',
         description=
@@ -1518,13 +1347,7 @@ class LocalObjective(OscalBaseModel):
     A local definition of a control objective for this assessment. Uses catalog syntax for control objective and assessment actions.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    control_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    control_id: NCNameStr = Field(
         ...,
         alias='control-id',
         description=
@@ -1547,9 +1370,6 @@ class ParameterSelection(OscalBaseModel):
     Presenting a choice among alternatives
     """
 
-    class Config:
-        extra = Extra.forbid
-
     how_many: Optional[HowMany] = Field(
         None,
         alias='how-many',
@@ -1565,31 +1385,19 @@ class Parameter(OscalBaseModel):
     Parameters provide a mechanism for the dynamic assignment of value(s) in a control.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    id: NCNameStr = Field(
         ...,
         description=
         'A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined parameter elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Parameter Identifier',
     )
-    class_: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    class_: Optional[NCNameStr] = Field(
         None,
         alias='class',
         description='A textual label that provides a characterization of the parameter.',
         title='Parameter Class',
     )
-    depends_on: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    depends_on: Optional[NCNameStr] = Field(
         None,
         alias='depends-on',
         description=
@@ -1621,22 +1429,14 @@ class OriginActor(OscalBaseModel):
     The actor that produces an observation, a finding, or a risk. One or more actor type can be used to specify a person that is using a tool.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     type: Type3 = Field(..., description='The kind of actor.', title='Actor Type')
-    actor_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    actor_uuid: UUIDStr = Field(
         ...,
         alias='actor-uuid',
         description='A machine-oriented identifier reference to the tool or person based on the associated type.',
         title='Actor Universally Unique Identifier Reference',
     )
-    role_id: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    role_id: Optional[NCNameStr] = Field(
         None,
         alias='role-id',
         description='For a party, this can optionally be used to specify the role the actor was performing.',
@@ -1651,12 +1451,7 @@ class Location(OscalBaseModel):
     A location, with associated metadata that can be referenced.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this defined location elsewhere in this or other OSCAL instances. The locally defined UUID of the location can be used to reference the data item locally or globally (e.g., from an importing OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -1681,9 +1476,6 @@ class Metadata(OscalBaseModel):
     Provides information about the publication and availability of the containing document.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     title: str = Field(
         ...,
         description='A name given to the document, which may be used by a tool for display and navigation.',
@@ -1709,12 +1501,7 @@ class ImplementedComponent(OscalBaseModel):
     The set of components that are implemented in a given system inventory item.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    component_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    component_uuid: UUIDStr = Field(
         ...,
         alias='component-uuid',
         description=
@@ -1732,12 +1519,7 @@ class InventoryItem(OscalBaseModel):
     A single managed inventory item within the system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this inventory item elsewhere in this or other OSCAL instances. The locally defined UUID of the inventory item can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -1760,12 +1542,7 @@ class IdentifiedSubject(OscalBaseModel):
     Used to detail assessment subjects that were identfied by this task.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    subject_placeholder_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    subject_placeholder_uuid: UUIDStr = Field(
         ...,
         alias='subject-placeholder-uuid',
         description=
@@ -1780,16 +1557,12 @@ class RelatedTask(OscalBaseModel):
     Identifies an individual task for which the containing object is a consequence of.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    task_uuid: constr(regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-                      ) = Field(
-                          ...,
-                          alias='task-uuid',
-                          description='A machine-oriented identifier reference to a unique task.',
-                          title='Task Universally Unique Identifier Reference',
-                      )
+    task_uuid: UUIDStr = Field(
+        ...,
+        alias='task-uuid',
+        description='A machine-oriented identifier reference to a unique task.',
+        title='Task Universally Unique Identifier Reference',
+    )
     props: Optional[List[Property]] = Field(None)
     links: Optional[List[Link]] = Field(None)
     responsible_parties: Optional[List[ResponsibleParty]] = Field(None, alias='responsible-parties')
@@ -1808,12 +1581,7 @@ class RelatedResponse(OscalBaseModel):
     Identifies an individual risk response that this log entry is for.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    response_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    response_uuid: UUIDStr = Field(
         ...,
         alias='response-uuid',
         description='A machine-oriented identifier reference to a unique risk response.',
@@ -1830,12 +1598,7 @@ class AssociatedActivity(OscalBaseModel):
     Identifies an individual activity to be performed as part of a task.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    activity_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    activity_uuid: UUIDStr = Field(
         ...,
         alias='activity-uuid',
         description='A machine-oriented identifier reference to an activity defined in the list of activities.',
@@ -1853,21 +1616,13 @@ class Task(OscalBaseModel):
     Represents a scheduled event or milestone, which may be associated with a series of assessment actions.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this task elsewhere in this or other OSCAL instances. The locally defined UUID of the task can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Task Universally Unique Identifier',
     )
-    type: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(..., description='The type of task.', title='Task Type')
+    type: NCNameStr = Field(..., description='The type of task.', title='Task Type')
     title: str = Field(..., description='The title for this task.', title='Task Title')
     description: Optional[str] = Field(
         None,
@@ -1894,12 +1649,7 @@ class UsesComponent(OscalBaseModel):
     The set of components that are used by the assessment platform.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    component_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    component_uuid: UUIDStr = Field(
         ...,
         alias='component-uuid',
         description=
@@ -1917,12 +1667,7 @@ class AssessmentPlatform(OscalBaseModel):
     Used to represent the toolset used to perform aspects of the assessment.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this assessment platform elsewhere in this or other OSCAL instances. The locally defined UUID of the assessment platform can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -61,13 +61,7 @@ class SelectControlById(OscalBaseModel):
     Used to select a control for inclusion/exclusion based on one or more control identifiers. A set of statement identifiers can be used to target the inclusion/exclusion to only specific control statements providing more granularity over the specific statements that are within the asessment scope.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    control_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    control_id: common.NCNameStr = Field(
         ...,
         alias='control-id',
         description=
@@ -82,12 +76,7 @@ class RelatedObservation(OscalBaseModel):
     Relates the poam-item to a set of referenced observations that were used to determine the finding.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    observation_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    observation_uuid: common.UUIDStr = Field(
         ...,
         alias='observation-uuid',
         description='A machine-oriented identifier reference to an observation defined in the list of observations.',
@@ -100,9 +89,6 @@ class Origin1(OscalBaseModel):
     Identifies the source of the finding, such as a tool, interviewed person, or activity.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     actors: List[common.OriginActor] = Field(...)
     related_tasks: Optional[List[common.RelatedTask]] = Field(None, alias='related-tasks')
 
@@ -112,14 +98,11 @@ class Origin(OscalBaseModel):
     Identifies the source of the finding, such as a tool or person.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     actors: List[common.OriginActor] = Field(...)
 
 
 class Method(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$') = Field(
+    __root__: common.NonSpaceStr = Field(
         ...,
         description='Identifies how the observation was made.',
         title='Observation Method',
@@ -131,12 +114,7 @@ class Entry(OscalBaseModel):
     Identifies an individual risk response that occurred as part of managing an identified risk.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this risk log entry elsewhere in this or other OSCAL instances. The locally defined UUID of the risk log entry can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -166,15 +144,16 @@ class Entry(OscalBaseModel):
     related_responses: Optional[List[common.RelatedResponse]] = Field(None, alias='related-responses')
     remarks: Optional[common.Remarks] = None
 
+    @validator('start', 'end', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return common.parse_iso_datetime(v)
+
 
 class ControlSelection(OscalBaseModel):
     """
     Identifies the controls being assessed. In the assessment plan, these are the planned controls. In the assessment results, these are the actual controls, and reflects any changes from the plan.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: Optional[str] = Field(
         None,
         description='A human-readable description of in-scope controls specified for assessment.',
@@ -193,9 +172,6 @@ class Characterization(OscalBaseModel):
     A collection of descriptive data about the containing object from a specific origin.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
     origin: Origin1
@@ -207,18 +183,12 @@ class Status1(OscalBaseModel):
     A determination of if the objective is satisfied or not within a given system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     state: State1 = Field(
         ...,
         description='An indication as to whether the objective is satisfied or not.',
         title='Objective Status State',
     )
-    reason: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    reason: Optional[common.NCNameStr] = Field(
         None,
         description="The reason the objective was given it's status.",
         title='Objective Status Reason',
@@ -231,9 +201,6 @@ class Status(OscalBaseModel):
     Describes the operational status of the system component.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     state: State = Field(..., description='The operational status.', title='State')
     remarks: Optional[common.Remarks] = None
 
@@ -243,18 +210,13 @@ class SystemComponent(OscalBaseModel):
     A defined component that can be part of an implemented system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this component elsewhere in this or other OSCAL instances. The locally defined UUID of the component can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Component Identifier',
     )
-    type: constr(regex=r'^\S(.*\S)?$') = Field(
+    type: common.NonSpaceStr = Field(
         ...,
         description='A category describing the purpose of the component.',
         title='Component Type',
@@ -285,15 +247,16 @@ class SystemComponent(OscalBaseModel):
     protocols: Optional[List[common.Protocol]] = Field(None)
     remarks: Optional[common.Remarks] = None
 
+    @validator('type', pre=True)
+    def intern_vocabulary(cls, v):
+        return common.intern_str(v)
+
 
 class LocalDefinitions(OscalBaseModel):
     """
     Allows components, and inventory-items to be defined within the POA&M for circumstances where no OSCAL-based SSP exists, or is not delivered with the POA&M.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     components: Optional[List[SystemComponent]] = Field(None)
     inventory_items: Optional[List[common.InventoryItem]] = Field(None, alias='inventory-items')
     remarks: Optional[common.Remarks] = None
@@ -304,9 +267,6 @@ class RiskLog(OscalBaseModel):
     A log of all risk-related tasks taken.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     entries: List[Entry] = Field(...)
 
 
@@ -315,9 +275,6 @@ class ReviewedControls(OscalBaseModel):
     Identifies the controls being assessed and their control objectives.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: Optional[str] = Field(
         None,
         description='A human-readable description of control objectives.',
@@ -337,21 +294,13 @@ class Response(OscalBaseModel):
     Describes either recommended or an actual plan for addressing the risk.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this remediation elsewhere in this or other OSCAL instances. The locally defined UUID of the risk response can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Remediation Universally Unique Identifier',
     )
-    lifecycle: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    lifecycle: common.NCNameStr = Field(
         ...,
         description=
         'Identifies whether this is a recommendation, such as from an assessor or tool, or an actual plan accepted by the system owner.',
@@ -370,18 +319,17 @@ class Response(OscalBaseModel):
     tasks: Optional[List[common.Task]] = Field(None)
     remarks: Optional[common.Remarks] = None
 
+    @validator('lifecycle', pre=True)
+    def intern_vocabulary(cls, v):
+        return common.intern_str(v)
+
 
 class Risk(OscalBaseModel):
     """
     An identified risk.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this risk elsewhere in this or other OSCAL instances. The locally defined UUID of the risk can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -420,18 +368,17 @@ class Risk(OscalBaseModel):
     )
     related_observations: Optional[List[common.RelatedObservation1]] = Field(None, alias='related-observations')
 
+    @validator('deadline', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return common.parse_iso_datetime(v)
+
 
 class PoamItem(OscalBaseModel):
     """
     Describes an individual POA&M item.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    uuid: Optional[common.UUIDStr] = Field(
         None,
         description=
         'A machine-oriented, globally unique identifier with instance scope that can be used to reference this POA&M item entry in this OSCAL instance. This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -460,12 +407,7 @@ class Observation(OscalBaseModel):
     Describes an individual observation.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this observation elsewhere in this or other OSCAL instances. The locally defined UUID of the observation can be used to reference the data item locally or globally (e.g., in an imorted OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -497,18 +439,17 @@ class Observation(OscalBaseModel):
     )
     remarks: Optional[common.Remarks] = None
 
+    @validator('collected', 'expires', pre=True)
+    def datetime_from_iso_format(cls, v):
+        return common.parse_iso_datetime(v)
+
 
 class PlanOfActionAndMilestones(OscalBaseModel):
     """
     A plan of action and milestones which identifies initial and residual risks, deviations, and disposition, such as those required by FedRAMP.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with instancescope that can be used to reference this POA&M instance in this OSCAL instance. This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -529,12 +470,7 @@ class Step(OscalBaseModel):
     Identifies an individual step in a series of steps related to an activity, such as an assessment test or examination procedure.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this step elsewhere in this or other OSCAL instances. The locally defined UUID of the step (in a series of steps) can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -558,12 +494,7 @@ class Activity(OscalBaseModel):
     Identifies an assessment or related process that can be performed. In the assessment plan, this is an intended activity which may be associated with an assessment task. In the assessment results, this an activity that was actually performed as part of an assessment.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this assessment activity elsewhere in this or other OSCAL instances. The locally defined UUID of the activity can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -37,10 +37,7 @@ import trestle.oscal.common as common
 
 
 class WithId(OscalBaseModel):
-    __root__: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(..., description='', title='Match Controls by Identifier')
+    __root__: common.NCNameStr = Field(..., description='', title='Match Controls by Identifier')
 
 
 class WithChildControls(Enum):
@@ -57,32 +54,20 @@ class SetParameter(OscalBaseModel):
     A parameter setting, to be propagated to points of insertion
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    param_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    param_id: common.NCNameStr = Field(
         ...,
         alias='param-id',
         description=
         'A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined parameter elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Parameter ID',
     )
-    class_: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    class_: Optional[common.NCNameStr] = Field(
         None,
         alias='class',
         description='A textual label that provides a characterization of the parameter.',
         title='Parameter Class',
     )
-    depends_on: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    depends_on: Optional[common.NCNameStr] = Field(
         None,
         alias='depends-on',
         description=
@@ -113,49 +98,31 @@ class Remove(OscalBaseModel):
     Specifies objects to be removed from a control based on specific aspects of the object that must all match.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    by_name: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    by_name: Optional[common.NCNameStr] = Field(
         None,
         alias='by-name',
         description='Identify items to remove by matching their assigned name',
         title='Reference by (assigned) name',
     )
-    by_class: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    by_class: Optional[common.NCNameStr] = Field(
         None,
         alias='by-class',
         description='Identify items to remove by matching their class.',
         title='Reference by class',
     )
-    by_id: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    by_id: Optional[common.NCNameStr] = Field(
         None,
         alias='by-id',
         description='Identify items to remove indicated by their id.',
         title='Reference by ID',
     )
-    by_item_name: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    by_item_name: Optional[common.NCNameStr] = Field(
         None,
         alias='by-item-name',
         description="Identify items to remove by the name of the item's information element name, e.g. title or prop",
         title='Item Name Reference',
     )
-    by_ns: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    by_ns: Optional[common.NCNameStr] = Field(
         None,
         alias='by-ns',
         description="Identify items to remove by the item's ns, which is the namespace associated with a part, or prop.",
@@ -199,10 +166,7 @@ class Matching(OscalBaseModel):
     Select controls by (regular expression) match on ID
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    pattern: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    pattern: Optional[common.NonSpaceStr] = Field(
         None,
         description='A glob expression matching the IDs of one or more controls to be selected.',
         title='Pattern',
@@ -214,9 +178,6 @@ class Combine(OscalBaseModel):
     A Combine element defines how to combine multiple (competing) versions of the same control.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     method: Optional[Method] = Field(
         None,
         description='How clashing controls should be handled',
@@ -229,18 +190,12 @@ class Add(OscalBaseModel):
     Specifies contents to be added into controls, in resolution
     """
 
-    class Config:
-        extra = Extra.forbid
-
     position: Optional[Position] = Field(
         None,
         description='Where to add the new content with respect to the targeted element (beside it or inside it)',
         title='Position',
     )
-    by_id: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    by_id: Optional[common.NCNameStr] = Field(
         None,
         alias='by-id',
         description='Target location of the addition.',
@@ -262,13 +217,7 @@ class Alter(OscalBaseModel):
     An Alter element specifies changes to be made to an included control when a profile is resolved.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    control_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    control_id: common.NCNameStr = Field(
         ...,
         alias='control-id',
         description=
@@ -284,9 +233,6 @@ class Modify(OscalBaseModel):
     Set parameters or amend controls in resolution
     """
 
-    class Config:
-        extra = Extra.forbid
-
     set_parameters: Optional[List[SetParameter]] = Field(None, alias='set-parameters')
     alters: Optional[List[Alter]] = Field(None)
 
@@ -296,9 +242,6 @@ class SelectControlById(OscalBaseModel):
     Call a control by its ID
     """
 
-    class Config:
-        extra = Extra.forbid
-
     with_child_controls: Optional[WithChildControls] = Field(
         None,
         alias='with-child-controls',
@@ -314,9 +257,6 @@ class Import(OscalBaseModel):
     The import designates a catalog or profile to be included (referenced and potentially modified) by this profile. The import also identifies which controls to select using the include-all, include-controls, and exclude-controls directives.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     href: str = Field(
         ...,
         description='A resolvable URL reference to the base catalog or profile that this profile is tailoring.',
@@ -332,9 +272,6 @@ class InsertControls(OscalBaseModel):
     Specifies which controls to use in the containing context.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     order: Optional[Order] = Field(
         None,
         description='A designation of how a selection of controls in a profile is to be ordered.',
@@ -350,22 +287,13 @@ class Group(OscalBaseModel):
     A group of (selected) controls or of groups of controls
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    id: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    id: Optional[common.NCNameStr] = Field(
         None,
         description=
         'A human-oriented, locally unique identifier with cross-instance scope that can be used to reference this defined group elsewhere in this or other OSCAL instances. When referenced from another OSCAL instance, this identifier must be referenced in the context of the containing resource (e.g., import-profile). This id should be assigned per-subject, which means it should be consistently used to identify the same group across revisions of the document.',
         title='Group Identifier',
     )
-    class_: Optional[constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    )] = Field(
+    class_: Optional[common.NCNameStr] = Field(
         None,
         alias='class',
         description='A textual label that provides a sub-type or characterization of the group.',
@@ -389,9 +317,6 @@ class Custom(OscalBaseModel):
     A Custom element frames a structure for embedding represented controls in resolution.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     groups: Optional[List[Group]] = Field(None)
     insert_controls: Optional[List[InsertControls]] = Field(None, alias='insert-controls')
 
@@ -401,9 +326,6 @@ class Merge(OscalBaseModel):
     A Merge element provides structuring directives that drive how controls are organized after resolution.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     combine: Optional[Combine] = Field(
         None,
         description='A Combine element defines how to combine multiple (competing) versions of the same control.',
@@ -429,12 +351,7 @@ class Profile(OscalBaseModel):
     Each OSCAL profile is defined by a Profile element
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this profile elsewhere in this or other OSCAL instances. The locally defined UUID of the profile can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance).This identifier should be assigned per-subject, which means it should be consistently used to identify the same profile across revisions of the document.',
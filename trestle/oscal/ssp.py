@@ -73,13 +73,7 @@ class SetParameter(OscalBaseModel):
     Identifies the parameter that will be set by the enclosed value.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    param_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    param_id: common.NCNameStr = Field(
         ...,
         alias='param-id',
         description=
@@ -91,7 +85,7 @@ class SetParameter(OscalBaseModel):
 
 
 class Selected(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$') = Field(
+    __root__: common.NonSpaceStr = Field(
         ...,
         description='The selected (Confidentiality, Integrity, or Availability) security impact level.',
         title='Selected Level (Confidentiality, Integrity, or Availability)',
@@ -103,24 +97,21 @@ class SecurityImpactLevel(OscalBaseModel):
     The overall level of expected impact resulting from unauthorized disclosure, modification, or loss of access to information.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    security_objective_confidentiality: constr(regex=r'^\S(.*\S)?$') = Field(
+    security_objective_confidentiality: common.NonSpaceStr = Field(
         ...,
         alias='security-objective-confidentiality',
         description=
         'A target-level of confidentiality for the system, based on the sensitivity of information within the system.',
         title='Security Objective: Confidentiality',
     )
-    security_objective_integrity: constr(regex=r'^\S(.*\S)?$') = Field(
+    security_objective_integrity: common.NonSpaceStr = Field(
         ...,
         alias='security-objective-integrity',
         description=
         'A target-level of integrity for the system, based on the sensitivity of information within the system.',
         title='Security Objective: Integrity',
     )
-    security_objective_availability: constr(regex=r'^\S(.*\S)?$') = Field(
+    security_objective_availability: common.NonSpaceStr = Field(
         ...,
         alias='security-objective-availability',
         description=
@@ -134,20 +125,13 @@ class Satisfied(OscalBaseModel):
     Describes how this system satisfies a responsibility imposed by a leveraged system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this satisfied control implementation entry elsewhere in this or other OSCAL instances. The locally defined UUID of the control implementation can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Satisfied Universally Unique Identifier',
     )
-    responsibility_uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    responsibility_uuid: Optional[common.UUIDStr] = Field(
         None,
         alias='responsibility-uuid',
         description=
@@ -171,20 +155,13 @@ class Responsibility(OscalBaseModel):
     Describes a control implementation responsibility imposed on a leveraging system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this responsibility elsewhere in this or other OSCAL instances. The locally defined UUID of the responsibility can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Responsibility Universally Unique Identifier',
     )
-    provided_uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    provided_uuid: Optional[common.UUIDStr] = Field(
         None,
         alias='provided-uuid',
         description=
@@ -208,12 +185,7 @@ class Provided(OscalBaseModel):
     Describes a capability which may be inherited by a leveraging system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this provided entry elsewhere in this or other OSCAL instances. The locally defined UUID of the provided entry can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -236,20 +208,13 @@ class Inherited(OscalBaseModel):
     Describes a control implementation inherited by a leveraging system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this inherited entry elsewhere in this or other OSCAL instances. The locally defined UUID of the inherited control implementation can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Inherited Universally Unique Identifier',
     )
-    provided_uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    provided_uuid: Optional[common.UUIDStr] = Field(
         None,
         alias='provided-uuid',
         description=
@@ -268,7 +233,7 @@ class Inherited(OscalBaseModel):
 
 
 class InformationTypeId(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$') = Field(
+    __root__: common.NonSpaceStr = Field(
         ...,
         description=
         'A human-oriented, globally unique identifier qualified by the given identification system used, such as NIST SP 800-60. This identifier has cross-instance scope and can be used to reference this system elsewhere in this or other OSCAL instances. This id should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -281,9 +246,6 @@ class ImportProfile(OscalBaseModel):
     Used to import the OSCAL profile representing the system's control baseline.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     href: str = Field(
         ...,
         description="A resolvable URL reference to the profile to use as the system's control baseline.",
@@ -297,9 +259,6 @@ class Export(OscalBaseModel):
     Identifies content intended for external consumption, such as with leveraged organizations.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: Optional[str] = Field(
         None,
         description=
@@ -318,12 +277,7 @@ class Diagram(OscalBaseModel):
     A graphic that provides a visual representation the system, or some aspect of it.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this diagram elsewhere in this or other OSCAL instances. The locally defined UUID of the diagram can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -352,9 +306,6 @@ class DataFlow(OscalBaseModel):
     A description of the logical flow of information within the system and across its boundaries, optionally supplemented by diagrams that illustrate these flows.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: str = Field(
         ...,
         description="A summary of the system's data flow.",
@@ -371,9 +322,6 @@ class Categorization(OscalBaseModel):
     A set of information type identifiers qualified by the given identification system used, such as NIST SP 800-60.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     system: AnyUrl = Field(
         ...,
         description='Specifies the information type identification system used.',
@@ -387,20 +335,13 @@ class ByComponent(OscalBaseModel):
     Defines how the referenced component implements a set of controls.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    component_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    component_uuid: common.UUIDStr = Field(
         ...,
         alias='component-uuid',
         description='A machine-oriented identifier reference to the component that is implemeting a given control.',
         title='Component Universally Unique Identifier Reference',
     )
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this by-component entry elsewhere in this or other OSCAL instances. The locally defined UUID of the by-component entry can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -428,7 +369,7 @@ class ByComponent(OscalBaseModel):
 
 
 class Base(OscalBaseModel):
-    __root__: constr(regex=r'^\S(.*\S)?$') = Field(
+    __root__: common.NonSpaceStr = Field(
         ...,
         description='The prescribed base (Confidentiality, Integrity, or Availability) security impact level.',
         title='Base Level (Confidentiality, Integrity, or Availability)',
@@ -440,9 +381,6 @@ class AvailabilityImpact(OscalBaseModel):
     The expected level of impact resulting from the disruption of access to or use of the described information or the information system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
     base: Base
@@ -455,9 +393,6 @@ class AuthorizationBoundary(OscalBaseModel):
     A description of this system's authorization boundary, optionally supplemented by diagrams that illustrate the authorization boundary.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: str = Field(
         ...,
         description="A summary of the system's authorization boundary.",
@@ -474,9 +409,6 @@ class Status1(OscalBaseModel):
     Describes the operational status of the system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     state: State = Field(..., description='The current operating status.', title='State')
     remarks: Optional[common.Remarks] = None
 
@@ -486,9 +418,6 @@ class Status(OscalBaseModel):
     Describes the operational status of the system component.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     state: State1 = Field(..., description='The operational status.', title='State')
     remarks: Optional[common.Remarks] = None
 
@@ -498,18 +427,13 @@ class SystemComponent(OscalBaseModel):
     A defined component that can be part of an implemented system.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this component elsewhere in this or other OSCAL instances. The locally defined UUID of the component can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Component Identifier',
     )
-    type: constr(regex=r'^\S(.*\S)?$') = Field(
+    type: common.NonSpaceStr = Field(
         ...,
         description='A category describing the purpose of the component.',
         title='Component Type',
@@ -540,27 +464,23 @@ class SystemComponent(OscalBaseModel):
     protocols: Optional[List[common.Protocol]] = Field(None)
     remarks: Optional[common.Remarks] = None
 
+    @validator('type', pre=True)
+    def intern_vocabulary(cls, v):
+        return common.intern_str(v)
+
 
 class Statement(OscalBaseModel):
     """
     Identifies which statements within a control are addressed.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    statement_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    statement_id: common.NCNameStr = Field(
         ...,
         alias='statement-id',
         description='A human-oriented identifier reference to a control statement.',
         title='Control Statement Reference',
     )
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this control statement elsewhere in this or other OSCAL instances. The UUID of the control statement in the source OSCAL instance is sufficient to reference the data item locally or globally (e.g., in an imported OSCAL instance).',
@@ -578,21 +498,13 @@ class ImplementedRequirement(OscalBaseModel):
     Describes how the system satisfies an individual control.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this control requirement elsewhere in this or other OSCAL instances. The locally defined UUID of the control requirement can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
         title='Control Requirement Universally Unique Identifier',
     )
-    control_id: constr(
-        regex=
-        r'^[_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][_A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-\.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$'
-    ) = Field(
+    control_id: common.NCNameStr = Field(
         ...,
         alias='control-id',
         description=
@@ -613,9 +525,6 @@ class ControlImplementation(OscalBaseModel):
     Describes how the system satisfies a set of controls.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: str = Field(
         ...,
         description=
@@ -631,9 +540,6 @@ class NetworkArchitecture(OscalBaseModel):
     A description of the system's network architecture, optionally supplemented by diagrams that illustrate the network architecture.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     description: str = Field(
         ...,
         description="A summary of the system's network architecture.",
@@ -650,12 +556,7 @@ class LeveragedAuthorization(OscalBaseModel):
     A description of another authorized system from which this system inherits capabilities that satisfy security requirements. Another term for this concept is a common control provider.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope and can be used to reference this leveraged authorization elsewhere in this or other OSCAL instances. The locally defined UUID of the leveraged authorization can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -668,9 +569,7 @@ class LeveragedAuthorization(OscalBaseModel):
     )
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
-    party_uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    party_uuid: common.UUIDStr = Field(
         ...,
         alias='party-uuid',
         description='A machine-oriented identifier reference to the party that manages the leveraged system.',
@@ -685,9 +584,6 @@ class SystemImplementation(OscalBaseModel):
     Provides information as to how the system is implemented.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
     leveraged_authorizations: Optional[List[LeveragedAuthorization]] = Field(None, alias='leveraged-authorizations')
@@ -702,9 +598,6 @@ class IntegrityImpact(OscalBaseModel):
     The expected level of impact resulting from the unauthorized modification of the described information.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
     base: Base
@@ -717,9 +610,6 @@ class ConfidentialityImpact(OscalBaseModel):
     The expected level of impact resulting from the unauthorized disclosure of the described information.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
     base: Base
@@ -732,12 +622,7 @@ class InformationType(OscalBaseModel):
     Contains details about one information type that is stored, processed, or transmitted by the system, such as privacy information, and those defined in NIST SP 800-60.
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: Optional[constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    )] = Field(
+    uuid: Optional[common.UUIDStr] = Field(
         None,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this information type elsewhere in this or other OSCAL instances. The locally defined UUID of the information type can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance). This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
@@ -785,9 +670,6 @@ class SystemInformation(OscalBaseModel):
     Contains details about all information types that are stored, processed, or transmitted by the system, such as privacy information, and those defined in NIST SP 800-60.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
     information_types: List[InformationType] = Field(..., alias='information-types')
@@ -798,17 +680,14 @@ class SystemCharacteristics(OscalBaseModel):
     Contains the characteristics of the system, such as its name, purpose, and security impact level.
     """
 
-    class Config:
-        extra = Extra.forbid
-
     system_ids: List[common.SystemId] = Field(..., alias='system-ids')
-    system_name: constr(regex=r'^\S(.*\S)?$') = Field(
+    system_name: common.NonSpaceStr = Field(
         ...,
         alias='system-name',
         description='The full name of the system.',
         title='System Name - Full',
     )
-    system_name_short: Optional[constr(regex=r'^\S(.*\S)?$')] = Field(
+    system_name_short: Optional[common.NonSpaceStr] = Field(
         None,
         alias='system-name-short',
         description=
@@ -819,7 +698,7 @@ class SystemCharacteristics(OscalBaseModel):
     props: Optional[List[common.Property]] = Field(None)
     links: Optional[List[common.Link]] = Field(None)
     date_authorized: Optional[DateAuthorized] = Field(None, alias='date-authorized')
-    security_sensitivity_level: constr(regex=r'^\S(.*\S)?$') = Field(
+    security_sensitivity_level: common.NonSpaceStr = Field(
         ...,
         alias='security-sensitivity-level',
         description='The overall information system sensitivity categorization, such as defined by FIPS-199.',
@@ -840,12 +719,7 @@ class SystemSecurityPlan(OscalBaseModel):
     A system security plan, such as those described in NIST SP 800-18
     """
 
-    class Config:
-        extra = Extra.forbid
-
-    uuid: constr(
-        regex=r'^[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-4[0-9A-Fa-f]{3}-[89ABab][0-9A-Fa-f]{3}-[0-9A-Fa-f]{12}$'
-    ) = Field(
+    uuid: common.UUIDStr = Field(
         ...,
         description=
         'A machine-oriented, globally unique identifier with cross-instance scope that can be used to reference this system security plan (SSP) elsewhere in this or other OSCAL instances. The locally defined UUID of the SSP can be used to reference the data item locally or globally (e.g., in an imported OSCAL instance).This UUID should be assigned per-subject, which means it should be consistently used to identify the same subject across revisions of the document.',
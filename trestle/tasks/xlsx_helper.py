@@ -16,12 +16,12 @@
 
 import logging
 import pathlib
-import string
-from typing import Any, Dict, Iterator, List, Tuple
+import re
+from typing import Any, Dict, Iterator, List, Set, Tuple
 
 from openpyxl import load_workbook
 from openpyxl.cell.cell import MergedCell
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import column_index_from_string, get_column_letter
 
 from trestle import __version__
 from trestle.common.err import TrestleError
@@ -32,6 +32,9 @@ from trestle.tasks.base_task import TaskBase
 
 logger = logging.getLogger(__name__)
 
+# parenthesized statement part of a control, e.g. the (a) of ac-2(a)
+_STATEMENT_PATTERN = re.compile(r'\([a-z]\)')
+
 
 def get_trestle_version() -> str:
     """Get trestle version wrapper."""
@@ -209,31 +212,37 @@ class XlsxHelper:
         """Load."""
         self._spread_sheet = spread_sheet
         self._sheet_name = sheet_name
-        self._wb = load_workbook(self._spread_sheet)
+        # cell values only: cached formula results, no external links;
+        # not read_only since header names may span merged cells
+        self._wb = load_workbook(self._spread_sheet, data_only=True, keep_links=False)
         self._work_sheet = self._wb[self._sheet_name]
         self._map_name_to_letters = {}
-        # accumulators
-        self.rows_missing_control_id = []
-        self.rows_missing_goal_name_id = []
-        self.rows_invalid_goal_name_id = []
-        self.rows_missing_rule_name_id = []
-        self.rows_invalid_rule_name_id = []
-        self.rows_invalid_parameter_name = []
-        self.rows_missing_controls = []
-        self.rows_missing_parameters = []
-        self.rows_missing_parameters_values = []
-        self.rows_filtered = []
+        self._row = None
+        self._row_values = ()
+        # accumulators (sets of rows, reported sorted)
+        self.rows_missing_control_id = set()
+        self.rows_missing_goal_name_id = set()
+        self.rows_invalid_goal_name_id = set()
+        self.rows_missing_rule_name_id = set()
+        self.rows_invalid_rule_name_id = set()
+        self.rows_invalid_parameter_name = set()
+        self.rows_missing_controls = set()
+        self.rows_missing_parameters = set()
+        self.rows_missing_parameters_values = set()
+        self.rows_filtered = set()
         # map columns
         self._map_columns()
 
     def row_generator(self) -> Iterator[int]:
         """Generate rows until control_id is None."""
-        row = 1
         rows_skipped_consecutive = 0
         # assume no more data when 100 consecutve rows no control id
         rows_skipped_consecutive_limit = 100
-        while True:
-            row = row + 1
+        # stream row values once, rather than one cell lookup per column per row
+        rows = self._work_sheet.iter_rows(min_row=2, max_col=self._max_mapped_column, values_only=True)
+        for row, values in enumerate(rows, start=2):
+            self._row = row
+            self._row_values = values
             control_id = self._get_control_id(row)
             goal_id = self.get_goal_name_id(row)
             if control_id is None and goal_id is None:
@@ -258,7 +267,7 @@ class XlsxHelper:
         if self._column.filter_column is None:
             return False
         col = self._get_column_letter(self._column.filter_column)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_cell_value(col, row)
         if value is None:
             return False
         if value.lower() != 'yes':
@@ -269,7 +278,7 @@ class XlsxHelper:
     def get_goal_name_id(self, row: int, strict: bool = True) -> str:
         """Get goal_name_id from work_sheet."""
         col = self._get_column_letter(self._column.goal_name_id)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_cell_value(col, row)
         if value is None:
             self._add_row(row, self.rows_missing_goal_name_id)
         else:
@@ -288,7 +297,7 @@ class XlsxHelper:
     def get_rule_name_id(self, row: int, strict: bool = False) -> str:
         """Get rule_name_id from work_sheet."""
         col = self._get_column_letter(self._column.rule_name_id)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_cell_value(col, row)
         if value is None:
             self._add_row(row, self.rows_missing_rule_name_id)
         else:
@@ -307,7 +316,7 @@ class XlsxHelper:
     def get_parameter_value_default(self, row: int) -> str:
         """Get parameter_value_default from work_sheet."""
         col = self._get_column_letter(self._column.rename_values_alternatives)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_cell_value(col, row)
         if value is not None:
             value = str(value).split(',')[0].strip()
         return value
@@ -315,7 +324,7 @@ class XlsxHelper:
     def get_parameter_values(self, row: int) -> str:
         """Get parameter_values from work_sheet."""
         col = self._get_column_letter(self._column.rename_values_alternatives)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_cell_value(col, row)
         if value is None and self.get_parameter_name(row) is not None:
             self._add_row(row, self.rows_missing_parameters_values)
         # massage into comma separated list of values
@@ -330,7 +339,7 @@ class XlsxHelper:
     def _get_goal_text(self, row: int) -> str:
         """Get goal_text from work_sheet."""
         col = self._get_column_letter(self._column.control_text)
-        goal_text = self._work_sheet[col + str(row)].value
+        goal_text = self._get_cell_value(col, row)
         # normalize & tokenize
         value = goal_text.replace('\t', ' ')
         return value
@@ -361,7 +370,7 @@ class XlsxHelper:
         """
         value = {}
         for col in self._get_column_letter(self._column.nist_mappings):
-            control = self._work_sheet[col + str(row)].value
+            control = self._get_cell_value(col, row)
             if control is None:
                 continue
             # remove blanks
@@ -369,8 +378,7 @@ class XlsxHelper:
             if len(control) < 1 or control.lower() == 'none':
                 continue
             # remove rhs of : inclusive
-            if ':' in control:
-                control = control.split(':')[0]
+            control = control.partition(':')[0]
             # remove alphabet parts of control & accumulate in statements
             control, statements = self._normalize_control(control)
             # skip bogus control made up if dashes only
@@ -386,7 +394,7 @@ class XlsxHelper:
     def get_component_name(self, row: int) -> str:
         """Get component_name from work_sheet."""
         col = self._get_column_letter(self._column.resource_title)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_cell_value(col, row)
         if value is None:
             raise RuntimeError(f'row {row} col {col} missing component name')
         return value.strip()
@@ -400,17 +408,15 @@ class XlsxHelper:
         name = None
         description = None
         col = self._get_column_letter(self._column.rename_parameter_opt_parm)
-        combined_values = self._work_sheet[col + str(row)].value
+        combined_values = self._get_cell_value(col, row)
         if combined_values is not None:
-            if '\n' in combined_values:
-                parameter_parts = combined_values.split('\n')
-            elif ' ' in combined_values:
-                parameter_parts = combined_values.split(' ', 1)
-            else:
-                parameter_parts = combined_values
-            if len(parameter_parts) == 2:
-                name = parameter_parts[1].strip()
-                description = parameter_parts[0].strip()
+            # description and name separated by newline, else by first blank
+            head, separator, tail = combined_values.partition('\n')
+            if not separator:
+                head, separator, tail = combined_values.partition(' ')
+            if separator and '\n' not in tail:
+                name = tail.strip()
+                description = head.strip()
                 sname = str(name).strip()
                 name = sname.replace(' ', '_')
                 if name != sname:
@@ -425,9 +431,16 @@ class XlsxHelper:
     def _get_control_id(self, row: int) -> int:
         """Get control_id from work_sheet."""
         col = self._get_column_letter(self._column.control_id)
-        value = self._work_sheet[col + str(row)].value
+        value = self._get_cell_value(col, row)
         return value
 
+    def _get_cell_value(self, col: str, row: int) -> Any:
+        """Get cell value, from the streamed row values when available."""
+        column = column_index_from_string(col)
+        if row == self._row:
+            return self._row_values[column - 1]
+        return self._work_sheet.cell(row, column).value
+
     def _get_column_letter(self, name: str) -> str:
         """Get column letter."""
         value = self.map_name_to_letters[name]
@@ -484,6 +497,10 @@ class XlsxHelper:
                      self._column.rename_values_alternatives]:
             if name not in self.map_name_to_letters.keys():
                 raise RuntimeError(f'missing column {name}')
+        # columns past the last mapped one are never read
+        self._max_mapped_column = max(
+            column_index_from_string(letter) for letters in self.map_name_to_letters.values() for letter in letters
+        )
 
     def _add_column(self, name: str, column: int, limit: int) -> None:
         """Add column."""
@@ -507,37 +524,32 @@ class XlsxHelper:
 
     def _normalize_control(self, control: str) -> Tuple[str, List[str]]:
         """Remove parenthesized characters from controls."""
-        statements = []
-        for i in string.ascii_lowercase:
-            needle = '(' + i + ')'
-            if needle in control:
-                statements.append(needle)
-                control = control.replace(needle, '')
+        statements = sorted(set(_STATEMENT_PATTERN.findall(control)))
+        control = _STATEMENT_PATTERN.sub('', control)
         control = control.lower()
         return control, statements
 
-    def _add_row(self, row: int, account: List[int]) -> None:
-        """Add row to accounting list of rows."""
-        if row not in account:
-            account.append(row)
+    def _add_row(self, row: int, account: Set[int]) -> None:
+        """Add row to accounting set of rows."""
+        account.add(row)
 
     def report_issues(self) -> None:
         """Report issues."""
         if self.rows_missing_control_id:
-            logger.info(f'rows missing control_id: {self.rows_missing_control_id}')
+            logger.info(f'rows missing control_id: {sorted(self.rows_missing_control_id)}')
         if self.rows_invalid_goal_name_id:
-            logger.info(f'rows invalid goal_name_id: {self.rows_invalid_goal_name_id}')
+            logger.info(f'rows invalid goal_name_id: {sorted(self.rows_invalid_goal_name_id)}')
         if self.rows_missing_rule_name_id:
-            logger.info(f'rows missing rule_name_id: {self.rows_missing_rule_name_id}')
+            logger.info(f'rows missing rule_name_id: {sorted(self.rows_missing_rule_name_id)}')
         if self.rows_invalid_rule_name_id:
-            logger.info(f'rows invalid rule_name_id: {self.rows_invalid_rule_name_id}')
+            logger.info(f'rows invalid rule_name_id: {sorted(self.rows_invalid_rule_name_id)}')
         if self.rows_invalid_parameter_name:
-            logger.info(f'rows invalid parameter_name: {self.rows_invalid_parameter_name}')
+            logger.info(f'rows invalid parameter_name: {sorted(self.rows_invalid_parameter_name)}')
         if self.rows_missing_controls:
-            logger.info(f'rows missing controls: {self.rows_missing_controls}')
+            logger.info(f'rows missing controls: {sorted(self.rows_missing_controls)}')
         if self.rows_missing_parameters:
-            logger.info(f'rows missing parameters: {self.rows_missing_parameters}')
+            logger.info(f'rows missing parameters: {sorted(self.rows_missing_parameters)}')
         if self.rows_missing_parameters_values:
-            logger.info(f'rows missing parameters values: {self.rows_missing_parameters_values}')
+            logger.info(f'rows missing parameters values: {sorted(self.rows_missing_parameters_values)}')
         if self.rows_filtered:
-            logger.info(f'rows filtered: {self.rows_filtered}')
+            logger.info(f'rows filtered: {sorted(self.rows_filtered)}')
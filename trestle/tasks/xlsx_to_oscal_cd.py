@@ -65,8 +65,7 @@ class XlsxToOscalComponentDefinition(TaskBase):
         """
         super().__init__(config_object)
         self.xlsx_helper = XlsxHelper()
-        self._timestamp = datetime.datetime.utcnow().replace(microsecond=0).replace(tzinfo=datetime.timezone.utc
-                                                                                    ).isoformat()
+        self._timestamp = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0).isoformat()
 
     def set_timestamp(self, timestamp: str) -> None:
         """Set the timestamp."""
@@ -106,6 +105,12 @@ class XlsxToOscalComponentDefinition(TaskBase):
             return TaskOutcome('failure')
         # initialize
         self.defined_components = {}
+        self._control_ids = {}
+        # goal property config, the same for every row
+        self._namespace = self._get_namespace()
+        self._goal_name_id_class = self._get_class_for_property_name('goal_name_id')
+        self._goal_version_class = self._get_class_for_property_name('goal_version')
+        self._goal_version = self._get_goal_version()
         # roles, responsible_roles, parties, responsible parties
         party_uuid_01 = str(uuid.uuid4())
         party_uuid_02 = str(uuid.uuid4())
@@ -142,6 +147,9 @@ class XlsxToOscalComponentDefinition(TaskBase):
     def _process_rows(self, responsible_roles: List[ResponsibleRole]) -> None:
         """Process spread sheet rows."""
         ci_map = {}
+        # control implementation source and catalog title are the same for every row
+        source = self._get_catalog_url()
+        catalog_title = self._get_catalog_title()
         for row in self.xlsx_helper.row_generator():
             # quit when first row with no goal_id encountered
             goal_name_id = self.xlsx_helper.get_goal_name_id(row)
@@ -155,9 +163,8 @@ class XlsxToOscalComponentDefinition(TaskBase):
             # parameter
             parameter_name, parameter_description = self.xlsx_helper.get_parameter_name_and_description(row)
             # control implementations
-            source = self._get_catalog_url()
-            description = component_name + ' implemented controls for ' + self._get_catalog_title(
-            ) + '. It includes assessment asset configuration for CICD.'
+            description = component_name + ' implemented controls for ' + catalog_title
+            description += '. It includes assessment asset configuration for CICD.'
             key = source + key_sep + description
             control_implementation = ci_map.get(key)
             if not control_implementation:
@@ -192,24 +199,25 @@ class XlsxToOscalComponentDefinition(TaskBase):
         """Add implemented requirements."""
         goal_remarks = self.xlsx_helper.get_goal_remarks(row)
         parameter_value_default = self.xlsx_helper.get_parameter_value_default(row)
+        # goal properties are the same for every control of the row
+        prop1 = Property(
+            name='goal_name_id',
+            class_=self._goal_name_id_class,
+            value=goal_name_id,
+            ns=self._namespace,
+            remarks=Remarks(__root__=str(goal_remarks))
+        )
+        prop2 = Property(
+            name='goal_version',
+            class_=self._goal_version_class,
+            value=self._goal_version,
+            ns=self._namespace,
+            remarks=Remarks(__root__=str(goal_name_id))
+        )
+        props = [prop1, prop2]
         for control in controls.keys():
             control_uuid = str(uuid.uuid4())
-            prop1 = Property(
-                name='goal_name_id',
-                class_=self._get_class_for_property_name('goal_name_id'),
-                value=goal_name_id,
-                ns=self._get_namespace(),
-                remarks=Remarks(__root__=str(goal_remarks))
-            )
-            prop2 = Property(
-                name='goal_version',
-                class_=self._get_class_for_property_name('goal_version'),
-                value=self._get_goal_version(),
-                ns=self._get_namespace(),
-                remarks=Remarks(__root__=str(goal_name_id))
-            )
-            props = [prop1, prop2]
-            control_id, _ = self.catalog_interface.get_control_id_and_status(control)
+            control_id = self._get_control_id(control)
             if not control_id:
                 logger.info(f'row {row} control {control} not found in catalog')
                 control_id = control
@@ -228,6 +236,14 @@ class XlsxToOscalComponentDefinition(TaskBase):
             # implemented_requirements
             control_implementation.implemented_requirements.append(implemented_requirement)
 
+    def _get_control_id(self, control: str) -> str:
+        """Get catalog control id for control, looking up each control only once."""
+        control_id = self._control_ids.get(control)
+        if control_id is None:
+            control_id, _ = self.catalog_interface.get_control_id_and_status(control)
+            self._control_ids[control] = control_id
+        return control_id
+
     def _add_statements(
         self,
         row: int,
@@ -92,7 +92,7 @@ class XlsxToOscalProfile(TaskBase):
         # calculate output file name & check writability
         oname = 'profile.json'
         ofile = opth / oname
-        if not self._overwrite and pathlib.Path(ofile).exists():
+        if not self._overwrite and ofile.exists():
             logger.error(f'output: {ofile} already exists')
             return TaskOutcome('failure')
         # create OSCAL Profile
@@ -127,7 +127,7 @@ class XlsxToOscalProfile(TaskBase):
         # write OSCAL Profile to file
         if self._verbose:
             logger.info(f'output: {ofile}')
-        profile.oscal_write(pathlib.Path(ofile))
+        profile.oscal_write(ofile)
         # issues
         self._report_issues()
         return TaskOutcome('success')
@@ -165,41 +165,35 @@ class XlsxToOscalProfile(TaskBase):
 
     def _get_with_ids_by_control(self) -> List[str]:
         """Get controls from spread sheet."""
-        control_list = []
+        # dict as insertion ordered set, so controls with equal sort keys keep first seen order
+        control_dict = {}
         for row in self.xlsx_helper.row_generator():
             # quit when first row with no goal_id encountered
             controls = self.xlsx_helper.get_controls(row)
             if controls is not None:
                 for control in controls:
-                    control = self._oscal_namify(control)
-                    if control in control_list:
-                        continue
-                    control_list.append(control)
-        return sorted(control_list, key=self._control_sort_key)
+                    control_dict[self._oscal_namify(control)] = None
+        return sorted(control_dict, key=self._control_sort_key)
 
     def _get_with_ids_by_rule(self) -> List[str]:
         """Get rules from spread sheet."""
-        rule_name_id_list = []
+        rule_name_id_set = set()
         for row in self.xlsx_helper.row_generator():
             # quit when first row with no goal_id encountered
             rule_name_id = self.xlsx_helper.get_rule_name_id(row, strict=True)
             if rule_name_id is not None:
-                if rule_name_id in rule_name_id_list:
-                    continue
-                rule_name_id_list.append(rule_name_id)
-        return sorted(rule_name_id_list)
+                rule_name_id_set.add(rule_name_id)
+        return sorted(rule_name_id_set)
 
     def _get_with_ids_by_check(self) -> List[str]:
         """Get check from spread sheet."""
-        check_name_id_list = []
+        check_name_id_set = set()
         for row in self.xlsx_helper.row_generator():
             # quit when first row with no goal_id encountered
             check_name_id = self.xlsx_helper.get_check_name_id(row, strict=True)
             if check_name_id is not None:
-                if check_name_id in check_name_id_list:
-                    continue
-                check_name_id_list.append(check_name_id)
-        return sorted(check_name_id_list)
+                check_name_id_set.add(check_name_id)
+        return sorted(check_name_id_set)
 
     def _control_sort_key(self, control: str) -> (str, int, int):
         """Fabricate sort key."""